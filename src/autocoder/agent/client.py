@@ -5,6 +5,7 @@ Claude SDK Client Configuration
 Functions for creating and configuring the Claude Agent SDK client.
 """
 
+import functools
 import json
 import os
 import shutil
@@ -260,9 +261,11 @@ def create_client(
     guardrails = ToolUsageGuardrails.from_env()
     lock_guard = FileLockGuard.from_env()
 
+    # Bash runs in project_dir (the SDK cwd), which need not be this process's cwd.
+    bash_hook = functools.partial(bash_security_hook, project_dir=project_dir.resolve())
     pre_tool_use_matchers = [
         HookMatcher(hooks=[guardrails.pre_tool_use]),
-        HookMatcher(matcher="Bash", hooks=[bash_security_hook]),
+        HookMatcher(matcher="Bash", hooks=[bash_hook]),
     ]
     if lock_guard is not None:
         pre_tool_use_matchers.insert(1, HookMatcher(matcher="Write|Edit|MultiEdit", hooks=[lock_guard.pre_tool_use]))
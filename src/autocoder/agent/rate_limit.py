@@ -2,16 +2,31 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 try:
-    from zoneinfo import ZoneInfo
+    from zoneinfo import ZoneInfo, available_timezones
 except Exception:  # pragma: no cover - very old Python / missing tzdata
     ZoneInfo = None  # type: ignore[assignment]
+    available_timezones = None  # type: ignore[assignment]
 
 
 _RESET_RE = re.compile(r"(?i)\bresets(?:\s+at)?\s+(\d+)(?::(\d+))?\s*(am|pm)\s*\(([^)]+)\)")
 
 
+@lru_cache(maxsize=1)
+def _known_timezones() -> frozenset[str]:
+    # Walks the tzdata tree once, on the first reset-time parse rather than at import.
+    return frozenset(available_timezones())
+
+
+@lru_cache(maxsize=128)
+def _get_zoneinfo(name: str) -> "ZoneInfo":
+    # ZoneInfo instances are immutable. ZoneInfo's own strong cache holds only 8 keys, so with
+    # more distinct tz names in play an evicted zone would be re-read from tzdata.
+    return ZoneInfo(name)
+
+
 def auto_continue_delay_from_rate_limit(
     response: str,
     *,
@@ -27,7 +42,9 @@ def auto_continue_delay_from_rate_limit(
     """
     if not response:
         return float(default_delay_s), None
-    if "limit reached" not in response.lower():
+    lowered = response.lower()
+    # Substring probes settle the common no-reset cases without running the regex.
+    if "limit reached" not in lowered or "resets" not in lowered:
         return float(default_delay_s), None
     if ZoneInfo is None:
         return float(default_delay_s), None
@@ -46,8 +63,13 @@ def auto_continue_delay_from_rate_limit(
     elif period == "am" and hour == 12:
         hour = 0
 
+    # Unknown names bail out here; ZoneInfo would search every TZPATH entry before raising
+    # (and lru_cache does not remember failures).
+    if tz_name not in _known_timezones():
+        return float(default_delay_s), None
+
     try:
-        tz = ZoneInfo(tz_name)
+        tz = _get_zoneinfo(tz_name)
         now_tz = now
         if now_tz is None:
             now_tz = datetime.now(tz)
@@ -9,6 +9,8 @@ Uses an allowlist approach - only explicitly permitted commands can run.
 import os
 import shlex
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
 from autocoder.core.project_config import load_project_config, SecuritySpec
@@ -73,21 +75,25 @@ ALLOWED_COMMANDS = {
 # Commands that need additional validation even when in the allowlist
 COMMANDS_NEEDING_EXTRA_VALIDATION = {"pkill", "chmod", "init.sh"}
 
-_SECURITY_CACHE: dict[str, tuple[float | None, SecuritySpec]] = {}
+# autocoder.yaml path -> ((st_mtime_ns, st_size) or None if missing, parsed spec); LRU-bounded.
+_SECURITY_CACHE: OrderedDict[str, tuple[tuple[int, int] | None, SecuritySpec]] = OrderedDict()
+_SECURITY_CACHE_MAX = 100
 
 
 def _get_project_security(project_dir: Path) -> SecuritySpec:
     cfg_path = (project_dir / "autocoder.yaml").resolve()
-    mtime: float | None = None
-    if cfg_path.exists():
-        try:
-            mtime = cfg_path.stat().st_mtime
-        except Exception:
-            mtime = None
+    # One stat() per call; size catches same-mtime rewrites on coarse-timestamp filesystems.
+    stamp: tuple[int, int] | None
+    try:
+        st = cfg_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
 
     key = str(cfg_path)
     cached = _SECURITY_CACHE.get(key)
-    if cached and cached[0] == mtime:
+    if cached and cached[0] == stamp:
+        _SECURITY_CACHE.move_to_end(key)
         return cached[1]
 
     try:
@@ -96,17 +102,33 @@ def _get_project_security(project_dir: Path) -> SecuritySpec:
     except Exception:
         spec = SecuritySpec()
 
-    _SECURITY_CACHE[key] = (mtime, spec)
+    _SECURITY_CACHE[key] = (stamp, spec)
+    _SECURITY_CACHE.move_to_end(key)
+    while len(_SECURITY_CACHE) > _SECURITY_CACHE_MAX:
+        _SECURITY_CACHE.popitem(last=False)
     return spec
 
 
-def _effective_allowlist(project_dir: Path) -> set[str]:
-    allowlist = set(ALLOWED_COMMANDS)
+@lru_cache(maxsize=64)
+def _allowlist_for(strict: bool, allow_commands: tuple[str, ...]) -> frozenset[str]:
+    # Entries are exact base command names, so a set lookup is the whole match.
+    if strict:
+        return frozenset(ALLOWED_COMMANDS)
+    return frozenset(ALLOWED_COMMANDS).union(allow_commands)
+
+
+def _effective_allowlist(project_dir: Path) -> frozenset[str]:
     security = _get_project_security(project_dir)
-    if security.strict:
-        return allowlist
-    allowlist.update(security.allow_commands)
-    return allowlist
+    return _allowlist_for(security.strict, tuple(security.allow_commands))
+
+
+@lru_cache(maxsize=1024)
+def _split(command_string: str) -> tuple[str, ...]:
+    """shlex.split, memoized: agents re-run the same handful of commands all session.
+
+    Raises ValueError on malformed input (not cached), like shlex.split.
+    """
+    return tuple(shlex.split(command_string))
 
 
 def split_command_segments(command_string: str) -> list[str]:
@@ -167,7 +189,7 @@ def extract_commands(command_string: str) -> list[str]:
             continue
 
         try:
-            tokens = shlex.split(segment)
+            tokens = _split(segment)
         except ValueError:
             # Malformed command (unclosed quotes, etc.)
             # Return empty to trigger block (fail-safe)
@@ -242,7 +264,7 @@ def validate_pkill_command(command_string: str) -> tuple[bool, str]:
     }
 
     try:
-        tokens = shlex.split(command_string)
+        tokens = _split(command_string)
     except ValueError:
         return False, "Could not parse pkill command"
 
@@ -279,7 +301,7 @@ def validate_chmod_command(command_string: str) -> tuple[bool, str]:
         Tuple of (is_allowed, reason_if_blocked)
     """
     try:
-        tokens = shlex.split(command_string)
+        tokens = _split(command_string)
     except ValueError:
         return False, "Could not parse chmod command"
 
@@ -324,7 +346,7 @@ def validate_init_script(command_string: str) -> tuple[bool, str]:
         Tuple of (is_allowed, reason_if_blocked)
     """
     try:
-        tokens = shlex.split(command_string)
+        tokens = _split(command_string)
     except ValueError:
         return False, "Could not parse init script command"
 
@@ -359,20 +381,30 @@ def get_command_for_validation(cmd: str, segments: list[str]) -> str:
     return ""
 
 
-async def bash_security_hook(input_data, tool_use_id=None, context=None):
+async def bash_security_hook(input_data, tool_use_id=None, context=None, *, project_dir: Path | None = None):
     """
     Pre-tool-use hook that validates bash commands using an allowlist.
 
-    Only commands in ALLOWED_COMMANDS are permitted.
+    Only commands in ALLOWED_COMMANDS are permitted. Thin async adapter over
+    `check_bash_command`, which does no I/O worth awaiting.
 
     Args:
         input_data: Dict containing tool_name and tool_input
         tool_use_id: Optional tool use ID
         context: Optional context
+        project_dir: Project whose autocoder.yaml extends the allowlist (bind with functools.partial);
+            defaults to the current working directory
 
     Returns:
         Empty dict to allow, or {"decision": "block", "reason": "..."} to block
     """
+    return check_bash_command(input_data, project_dir=project_dir)
+
+
+def check_bash_command(input_data, *, project_dir: Path | None = None) -> dict:
+    """
+    Synchronous core of `bash_security_hook` (same `input_data`, `project_dir` and return value).
+    """
     if input_data.get("tool_name") != "Bash":
         return {}
 
@@ -393,7 +425,7 @@ async def bash_security_hook(input_data, tool_use_id=None, context=None):
     # Split into segments for per-command validation
     segments = split_command_segments(command)
 
-    allowlist = _effective_allowlist(Path.cwd())
+    allowlist = _effective_allowlist(project_dir if project_dir is not None else Path.cwd())
 
     # Check each command against the allowlist
     for cmd in commands:
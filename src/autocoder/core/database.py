@@ -18,6 +18,9 @@ import logging
 import os
 import random
 import re
+import threading
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta, UTC
@@ -45,6 +48,27 @@ class Database:
         """
         self.db_path = Path(db_path).resolve()
         self._journal_mode = self._determine_journal_mode()
+        # Opt-in: only safe when a single process uses this DB file. Each connection then holds
+        # its lock until close, so SQLite skips the hot-journal probes on every transaction.
+        self._exclusive_locking = os.environ.get("AUTOCODER_SQLITE_EXCLUSIVE", "").strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "on",
+        }
+        # One long-lived connection per thread (pragmas run once). Off under exclusive locking,
+        # where a parked connection would hold the file lock forever; AUTOCODER_SQLITE_POOL=0
+        # restores a fresh connection per call.
+        self._pool_enabled = not self._exclusive_locking and os.environ.get(
+            "AUTOCODER_SQLITE_POOL", ""
+        ).strip().lower() not in {"0", "false", "no", "off"}
+        self._pool: dict[int, sqlite3.Connection] = {}  # thread ident -> connection
+        self._pool_busy: set[int] = set()
+        self._exclusive_held: dict[int, sqlite3.Connection] = {}  # thread ident -> outermost connection
+        self._pool_lock = threading.Lock()
+        self._pool_pid = os.getpid()
+        # Close parked connections when the instance is dropped rather than leaving them to GC.
+        self._pool_finalizer = weakref.finalize(self, _close_pool, self._pool, self._pool_pid)
         self._init_schema()
         logger.info(f"Database initialized: {self.db_path}")
 
@@ -135,23 +159,106 @@ class Database:
 
         return "WAL"
 
-    @contextmanager
-    def get_connection(self):
-        """Get a database connection with context manager."""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+    def _open_connection(self, *, shared: bool = False) -> sqlite3.Connection:
+        # shared: pooled connections may be closed by close() from another thread.
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=not shared)
         conn.row_factory = sqlite3.Row
         try:
             conn.execute("PRAGMA foreign_keys = ON")
             conn.execute(f"PRAGMA journal_mode = {self._journal_mode}")
             conn.execute("PRAGMA synchronous = NORMAL")
             conn.execute("PRAGMA busy_timeout = 10000")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            if self._exclusive_locking:
+                conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+            if self._journal_mode == "WAL":
+                # Local disk only (network filesystems never get WAL); reads skip the read() copies.
+                conn.execute("PRAGMA mmap_size = 268435456")
         except sqlite3.OperationalError:
             # Some pragmas may be unsupported in constrained environments; best-effort only.
             pass
+        return conn
+
+    def _pooled_connection(self, tid: int) -> sqlite3.Connection:
+        conn = self._pool.get(tid)
+        if conn is not None:
+            return conn
+        with self._pool_lock:
+            # Close connections parked by threads that have since exited.
+            alive = {t.ident for t in threading.enumerate()}
+            for dead in [t for t in self._pool if t not in alive]:
+                with contextlib.suppress(sqlite3.Error):
+                    self._pool.pop(dead).close()
+            conn = self._open_connection(shared=True)
+            self._pool[tid] = conn
+        return conn
+
+    @contextmanager
+    def get_connection(self):
+        """
+        Get a database connection with context manager.
+
+        Each thread reuses one pooled connection. Uncommitted work is rolled back on exit, as
+        closing used to do. A nested call on the same thread gets its own short-lived
+        connection so it can't commit or roll back the outer caller's transaction.
+
+        Under AUTOCODER_SQLITE_EXCLUSIVE the outer connection keeps the file lock until it
+        closes, so a second connection would only wait out busy_timeout; nested calls share the
+        outer connection instead (a nested commit then also commits the outer caller's work).
+        """
+        if self._pool_pid != os.getpid():
+            # Forked child: never touch the parent's connections.
+            self._pool, self._pool_busy, self._pool_pid = {}, set(), os.getpid()
+            self._exclusive_held = {}
+            self._pool_lock = threading.Lock()
+
+        tid = threading.get_ident()
+        if self._exclusive_locking:
+            held = self._exclusive_held.get(tid)
+            if held is not None:
+                yield held
+                return
+            conn = self._open_connection()
+            self._exclusive_held[tid] = conn
+            try:
+                yield conn
+            finally:
+                self._exclusive_held.pop(tid, None)
+                conn.close()
+            return
+
+        if not self._pool_enabled or tid in self._pool_busy:
+            conn = self._open_connection()
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        conn = self._pooled_connection(tid)
+        self._pool_busy.add(tid)
         try:
             yield conn
         finally:
-            conn.close()
+            self._pool_busy.discard(tid)
+            if conn.in_transaction:
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    # Unusable; drop it and let the next call open a fresh one.
+                    with contextlib.suppress(sqlite3.Error):
+                        conn.close()
+                    if self._pool.get(tid) is conn:
+                        del self._pool[tid]
+
+    def close(self) -> None:
+        """Close all pooled connections (e.g. at shutdown); later calls reopen on demand."""
+        with self._pool_lock:
+            conns = list(self._pool.values())
+            self._pool.clear()
+        for conn in conns:
+            with contextlib.suppress(sqlite3.Error):
+                conn.close()
 
     @contextmanager
     def atomic_transaction(self):
@@ -178,16 +285,6 @@ class Database:
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
-            # Pragmas for better concurrency under multiple processes.
-            # (Safe to run repeatedly; journal_mode is persistent for the DB file.)
-            try:
-                cursor.execute(f"PRAGMA journal_mode = {self._journal_mode}")
-                cursor.execute("PRAGMA synchronous = NORMAL")
-                cursor.execute("PRAGMA busy_timeout = 10000")
-                cursor.execute("PRAGMA foreign_keys = ON")
-            except sqlite3.OperationalError:
-                pass
-
             # Features table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS features (
@@ -505,6 +602,11 @@ class Database:
                 ON activity_events(feature_id)
             """)
 
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_features_regression_of_id
+                ON features(regression_of_id)
+            """)
+
             conn.commit()
 
     def _max_feature_attempts(self) -> int:
@@ -1526,28 +1628,31 @@ class Database:
         ]
         steps_json = json.dumps(steps or default_steps)
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT name FROM features WHERE id = ?", (regression_of_id,))
-            parent = cursor.fetchone()
-            parent_name = str(parent[0]) if parent and parent[0] is not None else f"feature-{regression_of_id}"
-
-            # De-dupe: if there's already an open regression issue for this feature, update it.
+        # BEGIN IMMEDIATE: the dedupe lookup and the write happen under one write lock, so two
+        # reporters can't both miss the open issue and create duplicates.
+        with self.atomic_transaction() as (_conn, cursor):
+            # Parent name and the open issue (if any) in one round trip.
             cursor.execute(
                 """
-                SELECT id FROM features
-                WHERE regression_of_id = ?
-                  AND enabled = 1
-                  AND status IN ('PENDING','IN_PROGRESS','BLOCKED')
-                ORDER BY id DESC
-                LIMIT 1
+                SELECT
+                    (SELECT name FROM features WHERE id = ?),
+                    (
+                        SELECT id FROM features
+                        WHERE regression_of_id = ?
+                          AND enabled = 1
+                          AND status IN ('PENDING','IN_PROGRESS','BLOCKED')
+                        ORDER BY id DESC
+                        LIMIT 1
+                    )
                 """,
-                (regression_of_id,),
+                (regression_of_id, regression_of_id),
             )
-            existing = cursor.fetchone()
-            if existing:
-                issue_id = int(existing[0])
+            parent_name_raw, existing_id = cursor.fetchone()
+            parent_name = str(parent_name_raw) if parent_name_raw is not None else f"feature-{regression_of_id}"
+
+            # De-dupe: if there's already an open regression issue for this feature, update it.
+            if existing_id is not None:
+                issue_id = int(existing_id)
                 cursor.execute(
                     """
                     UPDATE features
@@ -1584,7 +1689,6 @@ class Database:
                     )
                 except Exception:
                     pass
-                conn.commit()
                 return {
                     "success": True,
                     "feature_id": issue_id,
@@ -1660,7 +1764,6 @@ class Database:
                 )
             except Exception:
                 pass
-            conn.commit()
             return {
                 "success": True,
                 "feature_id": issue_id,
@@ -2618,22 +2721,75 @@ class Database:
         }
 
 
+def _close_pool(pool: dict[int, sqlite3.Connection], owner_pid: int) -> None:
+    # Finalizer for a dropped Database; a forked child must not close its parent's connections.
+    if os.getpid() != owner_pid:
+        return
+    for conn in list(pool.values()):
+        with contextlib.suppress(sqlite3.Error):
+            conn.close()
+    pool.clear()
+
+
 # ============================================================================
 # Convenience Functions
 # ============================================================================
 
+# db path -> (instance, (st_dev, st_ino) of the file it initialized); LRU-bounded.
+_DATABASES: OrderedDict[str, tuple[Database, tuple[int, int]]] = OrderedDict()
+_DATABASES_MAX = 32
+_DATABASES_LOCK = threading.Lock()
+
+
 def get_database(project_dir: str) -> Database:
     """
     Get the database instance for a project.
 
+    Instances are shared per database file so their connection pools are reused across calls.
+    A missing or replaced file gets a fresh instance (and schema).
+
     Args:
         project_dir: Path to project directory
 
     Returns:
         Database instance
     """
-    db_path = Path(project_dir) / "agent_system.db"
-    return Database(str(db_path))
+    db_path = (Path(project_dir) / "agent_system.db").resolve()
+    key = str(db_path)
+    try:
+        st = db_path.stat()
+        file_id: tuple[int, int] | None = (st.st_dev, st.st_ino)
+    except OSError:
+        file_id = None
+
+    with _DATABASES_LOCK:
+        cached = _DATABASES.get(key)
+        if cached and cached[1] == file_id:
+            _DATABASES.move_to_end(key)
+            return cached[0]
+
+        db = Database(key)
+        st = db_path.stat()
+        _DATABASES[key] = (db, (st.st_dev, st.st_ino))
+        _DATABASES.move_to_end(key)
+        # Evicted instances close their pools once their last user drops them.
+        while len(_DATABASES) > _DATABASES_MAX:
+            _DATABASES.popitem(last=False)
+        return db
+
+
+def close_database(project_dir: str) -> None:
+    """
+    Drop the cached instance for a project and close its pooled connections.
+
+    Call before deleting or replacing the DB file: open handles block removal on Windows and
+    would otherwise keep serving the unlinked file on POSIX.
+    """
+    key = str((Path(project_dir) / "agent_system.db").resolve())
+    with _DATABASES_LOCK:
+        cached = _DATABASES.pop(key, None)
+    if cached:
+        cached[0].close()
 
 
 def init_database(project_dir: str) -> Database:
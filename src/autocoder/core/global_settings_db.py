@@ -31,8 +31,12 @@ def _settings_db_path() -> Path:
 
 
 def _connect() -> sqlite3.Connection:
-    path = _settings_db_path()
-    conn = sqlite3.connect(str(path))
+    override = (os.getenv("AUTOCODER_SETTINGS_DB_PATH") or "").strip()
+    if override.startswith("file:"):
+        # SQLite URI (e.g. `file:name?mode=memory&cache=shared` for tests); no directory to create.
+        conn = sqlite3.connect(override, uri=True)
+    else:
+        conn = sqlite3.connect(str(_settings_db_path()))
     conn.execute("PRAGMA foreign_keys=ON")
     conn.execute(
         """
@@ -120,7 +120,74 @@ class KnowledgeBase:
         Returns:
             Pattern ID
         """
-        pattern = ImplementationPattern(
+        pattern = self._build_pattern(feature, implementation, success, attempts, lessons_learned)
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute(self._INSERT_PATTERN_SQL, self._pattern_row(pattern))
+
+        pattern_id = cursor.lastrowid
+        conn.commit()
+        conn.close()
+
+        print(f"[KnowledgeBase] Stored pattern: {pattern.category}/{pattern.feature_name} (success={success})")
+        return pattern_id
+
+    def store_patterns(self, items: list[dict]) -> list[int]:
+        """
+        Store several implementation patterns in one transaction.
+
+        Args:
+            items: Dicts with the keyword arguments of `store_pattern`
+                (feature, implementation, success, and optionally attempts, lessons_learned)
+
+        Returns:
+            Pattern IDs, in the order of `items`
+        """
+        patterns = [
+            self._build_pattern(
+                item["feature"],
+                item["implementation"],
+                item["success"],
+                item.get("attempts", 1),
+                item.get("lessons_learned", ""),
+            )
+            for item in items
+        ]
+        if not patterns:
+            return []
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            pattern_ids = []
+            for pattern in patterns:
+                cursor.execute(self._INSERT_PATTERN_SQL, self._pattern_row(pattern))
+                pattern_ids.append(cursor.lastrowid)
+            conn.commit()
+        finally:
+            conn.close()
+
+        print(f"[KnowledgeBase] Stored {len(pattern_ids)} patterns")
+        return pattern_ids
+
+    _INSERT_PATTERN_SQL = """
+        INSERT INTO patterns (
+            category, feature_name, description, approach,
+            files_changed, model_used, success, created_at,
+            attempts, lessons_learned, project_dir
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _build_pattern(
+        feature: dict,
+        implementation: dict,
+        success: bool,
+        attempts: int,
+        lessons_learned: str,
+    ) -> ImplementationPattern:
+        return ImplementationPattern(
             category=feature.get("category", "unknown"),
             feature_name=feature.get("name", "unknown"),
             description=feature.get("description", ""),
@@ -133,16 +200,8 @@ class KnowledgeBase:
             lessons_learned=lessons_learned
         )
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO patterns (
-                category, feature_name, description, approach,
-                files_changed, model_used, success, created_at,
-                attempts, lessons_learned, project_dir
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    def _pattern_row(self, pattern: ImplementationPattern) -> tuple:
+        return (
             pattern.category,
             pattern.feature_name,
             pattern.description,
@@ -154,14 +213,7 @@ class KnowledgeBase:
             pattern.attempts,
             pattern.lessons_learned,
             str(self.project_dir) if self.project_dir else None
-        ))
-
-        pattern_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-
-        print(f"[KnowledgeBase] Stored pattern: {pattern.category}/{pattern.feature_name} (success={success})")
-        return pattern_id
+        )
 
     def get_similar_features(self, feature: dict, limit: int = 3) -> list[dict]:
         """
@@ -22,13 +22,21 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Mapping
 
+import contextlib
+import hashlib
 import json
+import os
 import yaml
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+try:  # libyaml-backed loader when PyYAML was built with it; same safe semantics, much faster.
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:  # pragma: no cover - PyYAML without libyaml
+    _YamlLoader = yaml.SafeLoader
+
 
 def _as_int(value: object) -> int | None:
     if value is None:
@@ -216,12 +224,74 @@ def _read_npm_scripts(project_dir: Path) -> dict[str, Any]:
     return scripts if isinstance(scripts, dict) else {}
 
 
+_YAML_CACHE_MAX_FILES = 64
+
+
+def _yaml_cache_path(path: Path) -> Path:
+    # Kept under the user's ~/.autocoder, never in the project, so worktrees stay clean.
+    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+    return Path.home() / ".autocoder" / "cache" / "project_config" / f"{digest}.json"
+
+
+def _prune_yaml_cache(cache_dir: Path) -> None:
+    # Worktrees and temp projects each leave a sidecar; keep only the most recently written ones.
+    with os.scandir(cache_dir) as it:
+        names = [e for e in it if e.name.endswith(".json")]
+    if len(names) <= _YAML_CACHE_MAX_FILES:
+        return  # names only; stat() just when there is something to evict
+    entries = sorted(((e.stat().st_mtime_ns, e.path) for e in names), reverse=True)
+    for _, stale in entries[_YAML_CACHE_MAX_FILES:]:
+        with contextlib.suppress(OSError):
+            os.unlink(stale)
+
+
 def _load_yaml(path: Path) -> dict[str, Any]:
+    """
+    Parse `path` as YAML, reusing a JSON sidecar keyed on the file's (mtime_ns, size).
+
+    JSON decoding is much cheaper than YAML parsing, and the sidecar survives process restarts.
+    The sidecar is only written when the data round-trips through JSON unchanged.
+    """
     try:
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        st = path.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return {}
+
+    cache_path: Path | None = None
+    is_new_sidecar = False
+    try:
+        cache_path = _yaml_cache_path(path)  # Path.home()/resolve() can fail; then just parse
+        cached = json.loads(cache_path.read_bytes())
+        if cached.get("stamp") == stamp and isinstance(cached.get("data"), dict):
+            return cached["data"]
+    except FileNotFoundError:
+        is_new_sidecar = True
     except Exception:
+        pass
+
+    try:
+        raw = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
+    except Exception:
+        return {}
+    if not isinstance(raw, dict):
         return {}
-    return raw if isinstance(raw, dict) else {}
+
+    if cache_path is None:
+        return raw
+    try:
+        payload = json.dumps({"stamp": stamp, "data": raw})
+        if json.loads(payload)["data"] == raw:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+            if is_new_sidecar:
+                # Rewrites of an existing sidecar can't grow the directory; skip the scan.
+                _prune_yaml_cache(cache_path.parent)
+    except Exception as e:
+        logger.debug("Skipping autocoder.yaml JSON cache for %s: %s", path, e)
+    return raw
 
 
 def load_project_config(project_dir: Path) -> ResolvedProjectConfig:
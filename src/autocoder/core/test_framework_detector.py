@@ -58,31 +58,36 @@ class TestFrameworkDetector:
         """
         logger.info(f"Detecting test framework for: {self.project_dir}")
 
+        # One directory listing serves every marker-file check below.
+        try:
+            with os.scandir(self.project_dir) as it:
+                entries = {entry.name: Path(entry.path) for entry in it}
+        except OSError:
+            entries = {}
+
         # Check for Python
-        if (self.project_dir / "pyproject.toml").exists() or \
-           (self.project_dir / "setup.py").exists() or \
-           (self.project_dir / "requirements.txt").exists():
+        if "pyproject.toml" in entries or "setup.py" in entries or "requirements.txt" in entries:
             self.framework_info = self._detect_python_framework()
             return self.framework_info
 
         # Check for JavaScript/TypeScript (Node.js)
-        if (self.project_dir / "package.json").exists():
+        if "package.json" in entries:
             self.framework_info = self._detect_javascript_framework()
             return self.framework_info
 
         # Check for Go
-        if (self.project_dir / "go.mod").exists():
+        if "go.mod" in entries:
             self.framework_info = self._detect_go_framework()
             return self.framework_info
 
         # Check for Ruby
-        if (self.project_dir / "Gemfile").exists():
+        if "Gemfile" in entries:
             self.framework_info = self._detect_ruby_framework()
             return self.framework_info
 
         # Check for iOS/Xcode projects
-        xcode_proj = list(self.project_dir.glob("*.xcodeproj"))
-        xcode_workspace = list(self.project_dir.glob("*.xcworkspace"))
+        xcode_proj = [p for name, p in entries.items() if name.endswith(".xcodeproj")]
+        xcode_workspace = [p for name, p in entries.items() if name.endswith(".xcworkspace")]
 
         if xcode_proj or xcode_workspace:
             self.framework_info = self._detect_ios_framework(xcode_workspace, xcode_proj)
@@ -27,6 +27,8 @@ REPO_MAP_FILES: dict[str, str] = {
     "INTEGRATIONS": "codebase_INTEGRATIONS.md",
 }
 
+_REPO_MAP_FILENAMES = frozenset(REPO_MAP_FILES.values())
+
 
 @dataclass(frozen=True)
 class RepoMapStatus:
@@ -38,15 +40,16 @@ class RepoMapStatus:
 
 def get_repo_map_status(project_dir: Path) -> RepoMapStatus:
     knowledge_dir = Path(project_dir).resolve() / "knowledge"
-    exists = knowledge_dir.exists() and knowledge_dir.is_dir()
-    present: list[str] = []
-    missing: list[str] = []
-
-    for filename in REPO_MAP_FILES.values():
-        if exists and (knowledge_dir / filename).exists():
-            present.append(filename)
-        else:
-            missing.append(filename)
+    # One listing instead of an exists() per expected file.
+    try:
+        with os.scandir(knowledge_dir) as it:
+            names = {entry.name for entry in it}
+        exists = True
+    except OSError:
+        names = set()
+        exists = False
+    present = _REPO_MAP_FILENAMES & names
+    missing = _REPO_MAP_FILENAMES - names
 
     return RepoMapStatus(
         exists=exists,
@@ -82,10 +82,15 @@ def _extract_json_from_text(text: str) -> dict | None:
     return None
 
 
+_OPEN_FENCE_RE = re.compile(r"^```(?:diff|patch)?\s*", re.IGNORECASE)
+
+
 def _strip_fences(text: str) -> str:
     s = (text or "").strip()
-    s = re.sub(r"^```(?:diff|patch)?\s*", "", s, flags=re.IGNORECASE)
-    s = re.sub(r"\s*```$", "", s)
+    s = _OPEN_FENCE_RE.sub("", s, count=1)
+    # A closing fence is just a suffix check; `\s*```$` as a regex backtracks over long whitespace runs.
+    if s.endswith("```"):
+        s = s[:-3]
     return s.strip()
 
 
@@ -249,25 +254,20 @@ def _apply_patch(repo: Path, patch_text: str) -> tuple[bool, str]:
         return False, "Patch did not look like a git-style unified diff (expected 'diff --git' or '---/+++' headers)"
     if not patch_text.endswith("\n"):
         patch_text += "\n"
-    with tempfile.NamedTemporaryFile("w", delete=False, suffix=".patch", encoding="utf-8") as f:
-        f.write(patch_text)
-        patch_path = f.name
-    try:
-        proc = subprocess.run(
-            ["git", "apply", "--whitespace=fix", patch_path],
-            cwd=str(repo),
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=120,
-        )
-        if proc.returncode != 0:
-            return False, (proc.stderr or proc.stdout or "git apply failed").strip()
-        return True, ""
-    finally:
-        with contextlib.suppress(Exception):
-            os.unlink(patch_path)
+    # Feed the patch on stdin: no temp file to write and unlink.
+    proc = subprocess.run(
+        ["git", "apply", "--whitespace=fix", "-"],
+        cwd=str(repo),
+        input=patch_text,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        timeout=120,
+    )
+    if proc.returncode != 0:
+        return False, (proc.stderr or proc.stdout or "git apply failed").strip()
+    return True, ""
 
 
 def _stage_and_commit(repo: Path, message: str) -> tuple[bool, str]:
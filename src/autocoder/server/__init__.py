@@ -95,7 +95,7 @@ def start_server(host: str | None = None, port: int | None = None, reload: bool
         if os.name == "nt":
             try:
                 from autocoder.server.services import terminal_manager
-                winpty_ok = bool(getattr(terminal_manager, "WINPTY_AVAILABLE", False))
+                winpty_ok = terminal_manager.winpty_available()
             except Exception:
                 winpty_ok = False
         else:
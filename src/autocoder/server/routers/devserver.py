@@ -49,6 +49,7 @@ class DevServerStatusResponse(BaseModel):
     url: str | None = None
     api_port: int | None = None
     web_port: int | None = None
+    dropped_lines: int = 0
 
 
 class DevServerStartRequest(BaseModel):
@@ -30,6 +30,7 @@ from ..schemas import (
     KnowledgeFileUpdate,
     KnowledgeFile,
 )
+from ...core.database import close_database
 from ...core.knowledge_files import get_knowledge_dir, list_knowledge_files, knowledge_file_meta
 
 # Lazy imports to avoid circular dependencies
@@ -467,6 +468,7 @@ async def delete_project(name: str, delete_files: bool = False):
 
     # Optionally delete files
     if delete_files and project_dir.exists():
+        close_database(str(project_dir))
         try:
             _rmtree_force(project_dir)
         except Exception as e:
@@ -555,7 +557,8 @@ async def reset_project(name: str, full_reset: bool = False):
 
     errors: list[str] = []
 
-    # Remove runtime DB files
+    # Remove runtime DB files (release pooled handles first; Windows won't unlink open files)
+    close_database(str(project_dir))
     for suffix in ("", "-wal", "-shm"):
         db_path = project_dir / f"agent_system.db{suffix}"
         if db_path.exists():
@@ -12,11 +12,14 @@ This is intentionally lightweight and framework-agnostic:
 from __future__ import annotations
 
 import asyncio
+import atexit
 import contextlib
 import json
 import logging
 import os
 import re
+import shlex
+import signal
 import subprocess
 import threading
 from collections import deque
@@ -39,6 +42,9 @@ _URL_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Characters that require a real shell (pipes, redirects, chaining, expansion, comments).
+_SHELL_METACHARS = frozenset("|&;<>$`*?(){}~#\n")
+
 
 def detect_dev_command(project_dir: Path) -> str | None:
     """
@@ -84,6 +90,27 @@ def detect_dev_command(project_dir: Path) -> str | None:
     return None
 
 
+def build_popen_args(command: str) -> tuple[str | list[str], bool]:
+    """
+    Return `(args, shell)` for launching a dev command via `subprocess.Popen`.
+
+    Simple commands are split into an argv so the dev server is our direct child
+    (no intermediate `/bin/sh`), which keeps PID tracking and signals accurate.
+    Commands using shell syntax, and all commands on Windows (where `npm` is a
+    `.cmd` shim), still go through the shell.
+    """
+    if os.name == "nt" or any(c in _SHELL_METACHARS for c in command):
+        return command, True
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return command, True
+    if not argv or "=" in argv[0]:
+        # Leading `VAR=value` assignments are shell syntax.
+        return command, True
+    return argv, False
+
+
 def extract_url(text: str) -> str | None:
     """Extract the first localhost URL from a line of output."""
     m = _URL_RE.search(text or "")
@@ -99,6 +126,9 @@ class DevServerManager:
     """
 
     MAX_LOG_LINES = 500
+    # Lines buffered between the stdout reader and subscriber dispatch; oldest are dropped
+    # when subscribers can't keep up so the reader never stalls the subprocess pipe.
+    OUTPUT_QUEUE_SIZE = 1024
 
     def __init__(self, project_name: str, project_dir: Path):
         self.project_name = project_name
@@ -113,7 +143,12 @@ class DevServerManager:
         self.web_port: int | None = None
 
         self._output_task: asyncio.Task | None = None
+        self._dispatch_task: asyncio.Task | None = None
+        self._output_queue: asyncio.Queue[str | None] | None = None
+        self.dropped_lines = 0
         self._output_callbacks: Set[Callable[[str], Awaitable[None]]] = set()
+        # Rebuilt on subscribe/unsubscribe so the per-line broadcast needs no lock or copy.
+        self._output_snapshot: tuple[Callable[[str], Awaitable[None]], ...] = ()
         self._status_callbacks: Set[Callable[[DevServerStatus], Awaitable[None]]] = set()
         self._callbacks_lock = threading.Lock()
 
@@ -140,10 +175,12 @@ class DevServerManager:
     def add_output_callback(self, cb: Callable[[str], Awaitable[None]]) -> None:
         with self._callbacks_lock:
             self._output_callbacks.add(cb)
+            self._output_snapshot = tuple(self._output_callbacks)
 
     def remove_output_callback(self, cb: Callable[[str], Awaitable[None]]) -> None:
         with self._callbacks_lock:
             self._output_callbacks.discard(cb)
+            self._output_snapshot = tuple(self._output_callbacks)
 
     def add_status_callback(self, cb: Callable[[DevServerStatus], Awaitable[None]]) -> None:
         with self._callbacks_lock:
@@ -188,12 +225,54 @@ class DevServerManager:
             logger.debug(f"Dev server callback error: {e}")
 
     async def _broadcast_output(self, line: str) -> None:
-        with self._callbacks_lock:
-            callbacks = list(self._output_callbacks)
-        for cb in callbacks:
+        for cb in self._output_snapshot:
             await self._safe_callback(cb, line)
 
+    def _enqueue_output(self, line: str | None) -> None:
+        q = self._output_queue
+        if q is None:
+            return
+        try:
+            q.put_nowait(line)
+        except asyncio.QueueFull:
+            with contextlib.suppress(asyncio.QueueEmpty):
+                q.get_nowait()
+            self.dropped_lines += 1
+            q.put_nowait(line)
+
+    async def _dispatch_output(self, q: asyncio.Queue[str | None]) -> None:
+        # A single consumer keeps lines in order for every subscriber.
+        while True:
+            line = await q.get()
+            if line is None:
+                return
+            await self._broadcast_output(line)
+
+    async def _stop_dispatch(self) -> None:
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._dispatch_task
+            self._dispatch_task = None
+        self._output_queue = None
+
+    async def _drain_dispatch(self, timeout: float = 2.0) -> None:
+        """Deliver lines queued ahead of the end-of-stream marker, then stop the dispatcher.
+
+        Keeps the last output lines ahead of the status broadcast; a stuck subscriber only
+        delays this by `timeout`.
+        """
+        task = self._dispatch_task
+        if task is not None and not task.done():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.shield(task), timeout)
+        await self._stop_dispatch()
+
     def _notify_status_change(self, status: DevServerStatus) -> None:
+        # Unlocked emptiness check is a benign race: a subscriber added concurrently
+        # simply misses this transition, same as if it had subscribed a moment later.
+        if not self._status_callbacks:
+            return
         with self._callbacks_lock:
             callbacks = list(self._status_callbacks)
         try:
@@ -220,16 +299,21 @@ class DevServerManager:
                 if url:
                     self.url = url
 
-                await self._broadcast_output(sanitized)
+                self._enqueue_output(sanitized)
         except asyncio.CancelledError:
             raise
         except Exception as e:
             logger.warning(f"Dev server output streaming error: {e}")
         finally:
-            if self.process and self.process.poll() is not None:
-                if self.status == "running":
-                    self.status = "crashed" if self.process.returncode else "stopped"
-                self._remove_lock()
+            # End-of-stream marker: the dispatcher drains what's left, then exits.
+            self._enqueue_output(None)
+
+        # Process exited on its own: subscribers get its last lines before the status change.
+        await self._drain_dispatch()
+        if self.process and self.process.poll() is not None:
+            if self.status == "running":
+                self.status = "crashed" if self.process.returncode else "stopped"
+            self._remove_lock()
 
     async def start(
         self,
@@ -251,33 +335,44 @@ class DevServerManager:
                 "No dev server command detected. Add `commands.dev` in autocoder.yaml or a package.json dev/start script.",
             )
 
-        env = os.environ.copy()
+        overlay: dict[str, str] = {}
         if api_port is not None:
-            env["AUTOCODER_API_PORT"] = str(api_port)
-            env.setdefault("PORT", str(api_port))
+            overlay["AUTOCODER_API_PORT"] = str(api_port)
+            if "PORT" not in os.environ:
+                overlay["PORT"] = str(api_port)
             self.api_port = api_port
         if web_port is not None:
-            env["AUTOCODER_WEB_PORT"] = str(web_port)
-            env.setdefault("VITE_PORT", str(web_port))
+            overlay["AUTOCODER_WEB_PORT"] = str(web_port)
+            if "VITE_PORT" not in os.environ:
+                overlay["VITE_PORT"] = str(web_port)
             self.web_port = web_port
+        # Inherit the parent environment as-is unless there is something to add.
+        env = {**os.environ, **overlay} if overlay else None
 
         try:
+            await self._stop_dispatch()
             self.command = resolved_cmd
             self.url = None
+            self.dropped_lines = 0
             self.api_port = api_port
             self.web_port = web_port
 
+            args, use_shell = build_popen_args(resolved_cmd)
             self.process = subprocess.Popen(
-                resolved_cmd,
-                shell=True,
+                args,
+                shell=use_shell,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 cwd=str(self.project_dir),
                 env=env,
+                # Own process group so stop() can reap forked children (e.g. Vite/esbuild).
+                start_new_session=os.name != "nt",
             )
             self.started_at = datetime.now()
             self.status = "running"
             self._create_lock()
+            self._output_queue = asyncio.Queue(maxsize=self.OUTPUT_QUEUE_SIZE)
+            self._dispatch_task = asyncio.create_task(self._dispatch_output(self._output_queue))
             self._output_task = asyncio.create_task(self._stream_output())
             return True, f"Dev server started with PID {self.process.pid}"
         except Exception as e:
@@ -286,6 +381,21 @@ class DevServerManager:
             self.status = "stopped"
             return False, f"Failed to start dev server: {e}"
 
+    def _signal_process(self, *, force: bool = False) -> None:
+        """Terminate (or kill) the dev server's process group on POSIX, the process on Windows."""
+        if not self.process:
+            return
+        if os.name != "nt":
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL if force else signal.SIGTERM)
+                return
+            except (ProcessLookupError, PermissionError):
+                pass
+        if force:
+            self.process.kill()
+        else:
+            self.process.terminate()
+
     async def stop(self) -> tuple[bool, str]:
         if not self.process or self.status == "stopped":
             return False, "Dev server is not running"
@@ -296,13 +406,15 @@ class DevServerManager:
                 with contextlib.suppress(asyncio.CancelledError):
                     await self._output_task
                 self._output_task = None
+            # The reader's end marker is queued; flush what's buffered before "stopped" goes out.
+            await self._drain_dispatch()
 
-            self.process.terminate()
+            self._signal_process()
             loop = asyncio.get_running_loop()
             try:
                 await asyncio.wait_for(loop.run_in_executor(None, self.process.wait), timeout=5.0)
             except asyncio.TimeoutError:
-                self.process.kill()
+                self._signal_process(force=True)
                 await loop.run_in_executor(None, self.process.wait)
 
             self.process = None
@@ -338,6 +450,7 @@ class DevServerManager:
             "url": self.url,
             "api_port": self.api_port,
             "web_port": self.web_port,
+            "dropped_lines": self.dropped_lines,
         }
 
 
@@ -346,10 +459,16 @@ _dev_lock = threading.Lock()
 
 
 def get_dev_server_manager(project_name: str, project_dir: Path) -> DevServerManager:
+    # Lock-free fast path for the common case; only creation needs the lock.
+    mgr = _dev_managers.get(project_name)
+    if mgr is not None:
+        return mgr
     with _dev_lock:
-        if project_name not in _dev_managers:
-            _dev_managers[project_name] = DevServerManager(project_name, project_dir)
-        return _dev_managers[project_name]
+        mgr = _dev_managers.get(project_name)
+        if mgr is None:
+            mgr = DevServerManager(project_name, project_dir)
+            _dev_managers[project_name] = mgr
+        return mgr
 
 
 async def cleanup_all_dev_servers() -> None:
@@ -360,3 +479,20 @@ async def cleanup_all_dev_servers() -> None:
         with contextlib.suppress(Exception):
             if m.status == "running":
                 await m.stop()
+
+
+@atexit.register
+def _kill_remaining_dev_servers() -> None:
+    """
+    Last-resort cleanup when the process exits without running `cleanup_all_dev_servers`.
+
+    Dev servers run in their own session, so Ctrl-C on the UI process never reaches them.
+    The normal lifespan shutdown stops them; this catches exits that skip it. A SIGKILL of
+    the UI process can still leave dev servers running.
+    """
+    with _dev_lock:
+        managers = list(_dev_managers.values())
+    for m in managers:
+        with contextlib.suppress(Exception):
+            if m.process is not None and m.process.poll() is None:
+                m._signal_process(force=True)
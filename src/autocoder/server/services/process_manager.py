@@ -11,11 +11,13 @@ import contextlib
 import logging
 import os
 import re
+import shutil
 import subprocess
 import sys
 import threading
 import time
 from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
@@ -44,6 +46,9 @@ SENSITIVE_PATTERNS = [
     r"aws[_-]?secret[=:][^\s]+",
 ]
 
+# Single compiled alternation so each line is scanned once instead of once per pattern.
+_SENSITIVE_RE = re.compile("|".join(f"(?:{p})" for p in SENSITIVE_PATTERNS), re.IGNORECASE)
+
 # Patterns for Claude CLI / API authentication failures.
 AUTH_ERROR_PATTERNS = [
     r"\bnot logged in\b",
@@ -89,8 +94,6 @@ def cleanup_tmpclaude_dirs(project_dir: Path) -> tuple[int, int]:
         return 0, 0
 
     project_dir = Path(project_dir).resolve()
-    deleted = 0
-    failed = 0
 
     max_age_s: float | None = None
     max_age_raw = str(os.environ.get("AUTOCODER_TMPCLAUDE_MAX_AGE_S", "")).strip()
@@ -98,27 +101,42 @@ def cleanup_tmpclaude_dirs(project_dir: Path) -> tuple[int, int]:
         with contextlib.suppress(Exception):
             max_age_s = float(max_age_raw)
 
-    for p in sorted(project_dir.glob("tmpclaude-*")):
-        try:
-            if not p.is_dir():
-                continue
-        except Exception:
-            continue
-
-        if max_age_s is not None:
-            with contextlib.suppress(Exception):
-                age_s = time.time() - float(p.stat().st_mtime)
-                if age_s < max_age_s:
+    # One readdir pass: DirEntry carries the type (and on Windows the stat) from the listing.
+    candidates: list[Path] = []
+    now = time.time()
+    try:
+        with os.scandir(project_dir) as it:
+            for entry in it:
+                if not entry.name.startswith("tmpclaude-"):
+                    continue
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if max_age_s is not None and now - entry.stat(follow_symlinks=False).st_mtime < max_age_s:
+                        continue
+                except OSError:
                     continue
+                candidates.append(Path(entry.path))
+    except OSError as e:
+        logger.debug("Failed to scan %s for tmpclaude dirs: %s", project_dir, e)
+        return 0, 0
 
+    def _remove(p: Path) -> bool:
         try:
-            import shutil
-
             shutil.rmtree(p, ignore_errors=False)
-            deleted += 1
+            return True
         except Exception as e:
-            failed += 1
             logger.debug("Failed to delete tmpclaude dir %s: %s", p, e)
+            return False
+
+    # rmtree is unlink/rmdir-bound and releases the GIL, so a few threads overlap the I/O.
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates)), thread_name_prefix="tmpclaude-rm") as ex:
+            results = list(ex.map(_remove, candidates))
+    else:
+        results = [_remove(p) for p in candidates]
+    deleted = sum(results)
+    failed = len(results) - deleted
 
     if deleted or failed:
         logger.info("tmpclaude cleanup: deleted=%s failed=%s", deleted, failed)
@@ -128,9 +146,7 @@ def cleanup_tmpclaude_dirs(project_dir: Path) -> tuple[int, int]:
 
 def sanitize_output(line: str) -> str:
     """Remove sensitive information from output lines."""
-    for pattern in SENSITIVE_PATTERNS:
-        line = re.sub(pattern, "[REDACTED]", line, flags=re.IGNORECASE)
-    return line
+    return _SENSITIVE_RE.sub("[REDACTED]", line)
 
 
 def is_auth_error(line: str) -> bool:
@@ -14,49 +14,50 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import itertools
 import logging
 import os
 import platform
+import secrets
 import shutil
 import subprocess
 import sys
 import threading
-import uuid
-from collections.abc import Callable
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TerminalInfo:
     id: str
     name: str
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at_ms: int = field(default_factory=lambda: int(time.time() * 1000))
 
+    @property
+    def created_at(self) -> str:
+        """Creation time as a local ISO-8601 string (formatted on demand)."""
+        return datetime.fromtimestamp(self.created_at_ms / 1000).isoformat()
 
-IS_WINDOWS = platform.system() == "Windows"
-_WINPTY_INSTALL_ATTEMPTED = False
 
-if IS_WINDOWS:
-    try:
-        from winpty import PtyProcess as WinPtyProcess  # type: ignore[import-not-found]
+IS_WINDOWS = platform.system() == "Windows"
 
-        WINPTY_AVAILABLE = True
-    except Exception:
-        WinPtyProcess = None  # type: ignore[assignment]
-        WINPTY_AVAILABLE = False
-else:
+if not IS_WINDOWS:
     import fcntl
     import pty
-    import select
     import signal
     import struct
     import termios
 
-    WINPTY_AVAILABLE = False
+# Max buffers per writev() call (POSIX IOV_MAX on Linux/macOS).
+_IOV_MAX = 1024
 
 
 def _auto_install_winpty_enabled() -> bool:
@@ -64,31 +65,7 @@ def _auto_install_winpty_enabled() -> bool:
     return raw not in {"0", "false", "no", "off"}
 
 
-def _try_import_winpty() -> bool:
-    global WinPtyProcess, WINPTY_AVAILABLE
-    try:
-        from winpty import PtyProcess as WinPtyProcess  # type: ignore[import-not-found]
-
-        WINPTY_AVAILABLE = True
-        return True
-    except Exception:
-        WinPtyProcess = None  # type: ignore[assignment]
-        WINPTY_AVAILABLE = False
-        return False
-
-
-def _ensure_winpty() -> bool:
-    global _WINPTY_INSTALL_ATTEMPTED
-    if WINPTY_AVAILABLE:
-        return True
-    if not IS_WINDOWS:
-        return False
-    if not _auto_install_winpty_enabled():
-        return False
-    if _WINPTY_INSTALL_ATTEMPTED:
-        return False
-    _WINPTY_INSTALL_ATTEMPTED = True
-
+def _install_winpty() -> bool:
     logger.info("Installing pywinpty for UI terminals (Windows)...")
     try:
         result = subprocess.run(
@@ -105,16 +82,43 @@ def _ensure_winpty() -> bool:
     except Exception as e:
         logger.warning("pywinpty auto-install failed: %s", e)
         return False
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _winpty() -> Any:
+    """
+    Load pywinpty's `PtyProcess` on first use (Windows only), auto-installing it once if enabled.
+
+    Returns None when unavailable. Cached so the import/install is attempted at most once.
+    """
+    if not IS_WINDOWS:
+        return None
+    try:
+        from winpty import PtyProcess  # type: ignore[import-not-found]
+
+        return PtyProcess
+    except Exception:
+        pass
+    if not _auto_install_winpty_enabled() or not _install_winpty():
+        return None
+    try:
+        from winpty import PtyProcess  # type: ignore[import-not-found]
 
-    return _try_import_winpty()
+        return PtyProcess
+    except Exception:
+        return None
 
 
-# Eager install on Windows to keep UI logs clean and terminals ready.
-if IS_WINDOWS and not WINPTY_AVAILABLE and _auto_install_winpty_enabled():
-    _ensure_winpty()
+def winpty_available() -> bool:
+    """True when Windows terminal sessions can be started (loads pywinpty on first call)."""
+    return _winpty() is not None
 
 
+@functools.lru_cache(maxsize=1)
 def _get_shell() -> str:
+    # Cached per process: PATH probing and existence checks can be slow on network mounts.
+    # cleanup_all_terminals() clears it so a reload picks up SHELL changes.
     if IS_WINDOWS:
         for candidate in ("pwsh.exe", "powershell.exe", "cmd.exe"):
             found = shutil.which(candidate)
@@ -131,12 +135,31 @@ def _get_shell() -> str:
     return "/bin/sh"
 
 
+def _open_pidfd(pid: int | None) -> int | None:
+    """Return a pidfd (Linux 5.3+) that turns readable when `pid` exits, or None if unsupported."""
+    if pid is None or not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+
 class TerminalSession:
+    # PTY output is coalesced before fan-out: a lone burst (typing echo) flushes almost
+    # immediately, sustained output is batched per frame, and large backlogs flush at once.
+    FLUSH_INTERACTIVE_S = 0.001
+    FLUSH_STREAMING_S = 0.016
+    FLUSH_MAX_BYTES = 65536
+    MAX_READS_PER_WAKEUP = 8
+    # One read drains a full PTY/pipe buffer (64 KB on Linux, ConPTY pipes).
+    READ_CHUNK_BYTES = 65536
+
     def __init__(self, project_name: str, project_dir: Path):
         self.project_name = project_name
         self.project_dir = Path(project_dir).resolve()
 
-        self._pty_process: WinPtyProcess | None = None
+        self._pty_process: Any = None
         self._master_fd: int | None = None
         self._child_pid: int | None = None
 
@@ -144,9 +167,22 @@ class TerminalSession:
         self._output_task: asyncio.Task | None = None
         self.last_error: str | None = None
 
+        # Copy-on-write: mutations rebuild the snapshot under the lock, broadcasts read it lock-free.
         self._output_callbacks: set[Callable[[bytes], None]] = set()
+        self._callbacks_snapshot: tuple[Callable[[bytes], None], ...] = ()
         self._callbacks_lock = threading.Lock()
 
+        # Reused read slab for the Unix reader; reads land here instead of a fresh bytes each.
+        self._read_buf = bytearray(self.READ_CHUNK_BYTES)
+        self._read_view = memoryview(self._read_buf)
+        self._pending_output = bytearray()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._write_queue: deque[bytes] = deque()
+        self._write_scheduled = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._last_flush = 0.0
+
     @property
     def is_active(self) -> bool:
         return self._is_active
@@ -165,24 +201,46 @@ class TerminalSession:
     def add_output_callback(self, callback: Callable[[bytes], None]) -> None:
         with self._callbacks_lock:
             self._output_callbacks.add(callback)
+            self._callbacks_snapshot = tuple(self._output_callbacks)
 
     def remove_output_callback(self, callback: Callable[[bytes], None]) -> None:
         with self._callbacks_lock:
             self._output_callbacks.discard(callback)
+            self._callbacks_snapshot = tuple(self._output_callbacks)
 
     def output_callback_count(self) -> int:
-        with self._callbacks_lock:
-            return len(self._output_callbacks)
+        return len(self._callbacks_snapshot)
 
     def _broadcast_output(self, data: bytes) -> None:
-        with self._callbacks_lock:
-            callbacks = list(self._output_callbacks)
-        for cb in callbacks:
+        for cb in self._callbacks_snapshot:
             try:
                 cb(data)
             except Exception:
                 pass
 
+    def _enqueue_output(self, data: bytes | memoryview) -> None:
+        self._pending_output += data
+        if len(self._pending_output) >= self.FLUSH_MAX_BYTES:
+            self._flush_output()
+            return
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            streaming = loop.time() - self._last_flush < self.FLUSH_STREAMING_S
+            delay = self.FLUSH_STREAMING_S if streaming else self.FLUSH_INTERACTIVE_S
+            self._flush_handle = loop.call_later(delay, self._flush_output)
+
+    def _flush_output(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending_output:
+            return
+        data = bytes(self._pending_output)
+        self._pending_output.clear()
+        with contextlib.suppress(RuntimeError):
+            self._last_flush = asyncio.get_running_loop().time()
+        self._broadcast_output(data)
+
     async def start(self) -> bool:
         if self._is_active:
             return True
@@ -192,9 +250,8 @@ class TerminalSession:
 
         try:
             if IS_WINDOWS:
-                if not WINPTY_AVAILABLE:
-                    _ensure_winpty()
-                if not WINPTY_AVAILABLE:
+                WinPtyProcess = _winpty()
+                if WinPtyProcess is None:
                     msg = (
                         "Windows terminal sessions disabled (pywinpty not available). "
                         "Fix: pip install pywinpty (or set AUTOCODER_AUTO_INSTALL_WINPTY=1 and restart autocoder-ui)."
@@ -202,14 +259,15 @@ class TerminalSession:
                     self.last_error = msg
                     logger.warning(msg)
                     return False
-                assert WinPtyProcess is not None
                 # WinPTY ultimately relies on CreateProcess; passing an unquoted exe path with spaces
                 # (e.g. "C:\\Program Files\\PowerShell\\7\\pwsh.exe") can fail as "C:\\Program".
                 cmd = subprocess.list2cmdline([shell])
                 self._pty_process = WinPtyProcess.spawn(
                     cmd,
                     cwd=str(self.project_dir),
-                    env=os.environ.copy(),
+                    # pywinpty only reads the mapping to build the child's env block, so the
+                    # live environ is passed as-is (settings applied at runtime stay visible).
+                    env=os.environ,
                 )
             else:
                 master_fd, slave_fd = pty.openpty()
@@ -231,9 +289,11 @@ class TerminalSession:
                 else:
                     # Parent
                     os.close(slave_fd)
+                    os.set_blocking(master_fd, False)
                     self._master_fd = master_fd
                     self._child_pid = pid
 
+            self._loop = asyncio.get_running_loop()
             self._is_active = True
             self._output_task = asyncio.create_task(self._read_output())
             logger.info(f"Terminal started for {self.project_name}")
@@ -251,88 +311,158 @@ class TerminalSession:
             await self._read_output_unix()
 
     async def _read_output_windows(self) -> None:
-        if self._pty_process is None:
+        proc = self._pty_process
+        if proc is None:
             return
-        try:
-            while self._is_active and self._pty_process is not None:
-                try:
-                    data = self._pty_process.read(4096)
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+        def _reader() -> None:
+            # One daemon thread per terminal: pywinpty reads block until output arrives (closing
+            # the PTY unblocks them), so a shared pool would cap how many terminals get output.
+            try:
+                while self._is_active:
+                    try:
+                        data = proc.read(self.READ_CHUNK_BYTES)
+                    except EOFError:
+                        break
+                    except Exception as e:
+                        if self._is_active:
+                            logger.debug(f"Windows PTY read error: {e}")
+                        break
                     if data:
                         if isinstance(data, str):
                             data = data.encode("utf-8", errors="replace")
-                        self._broadcast_output(data)
-                    else:
-                        if self._pty_process is None or not self._pty_process.isalive():
-                            break
-                        await asyncio.sleep(0.01)
-                except asyncio.CancelledError:
-                    raise
-                except Exception as e:
-                    if self._is_active:
-                        logger.debug(f"Windows PTY read error: {e}")
-                    break
+                        loop.call_soon_threadsafe(chunks.put_nowait, data)
+                    elif not proc.isalive():
+                        break
+            finally:
+                with contextlib.suppress(RuntimeError):  # loop already closed
+                    loop.call_soon_threadsafe(chunks.put_nowait, None)
+
+        threading.Thread(target=_reader, name=f"winpty-read-{self.project_name}", daemon=True).start()
+        try:
+            while (data := await chunks.get()) is not None:
+                self._enqueue_output(data)
         except asyncio.CancelledError:
             pass
         finally:
+            self._flush_output()
             if self._is_active:
                 self._is_active = False
 
     async def _read_output_unix(self) -> None:
-        if self._master_fd is None:
+        fd = self._master_fd
+        if fd is None:
             return
 
         loop = asyncio.get_running_loop()
-        try:
-            while self._is_active and self._master_fd is not None:
+        eof: asyncio.Future[None] = loop.create_future()
 
-                def read_with_select() -> bytes:
-                    if self._master_fd is None:
-                        return b""
-                    try:
-                        readable, _, _ = select.select([self._master_fd], [], [], 0.1)
-                        if readable:
-                            return os.read(self._master_fd, 4096)
-                        return b""
-                    except (OSError, ValueError):
-                        return b""
-
-                data = await loop.run_in_executor(None, read_with_select)
-                if data:
-                    self._broadcast_output(data)
-                elif not self._check_child_alive():
-                    break
+        def read_once() -> int:
+            """Read one chunk; 0 once nothing is buffered or the PTY hit EOF."""
+            try:
+                n = os.readv(fd, [self._read_buf])
+            except BlockingIOError:
+                return 0
+            except OSError:
+                # Linux reports EIO on the master once the shell side is closed.
+                n = 0
+            if n:
+                self._enqueue_output(self._read_view[:n])
+                return n
+            if not eof.done():
+                eof.set_result(None)
+            return 0
+
+        def on_readable() -> None:
+            # A full buffer means more is probably pending: keep reading (bounded, so other
+            # sessions still get a turn) instead of paying a selector round trip per chunk.
+            for _ in range(self.MAX_READS_PER_WAKEUP):
+                if read_once() < len(self._read_buf):
+                    return
+
+        def on_child_exit() -> None:
+            # The shell exited but background jobs may keep the PTY open (no EOF);
+            # drain what's already buffered and finish.
+            while read_once():
+                pass
+            if not eof.done():
+                eof.set_result(None)
+
+        loop.add_reader(fd, on_readable)
+        pidfd = _open_pidfd(self._child_pid)
+        if pidfd is not None:
+            loop.add_reader(pidfd, on_child_exit)
+
+        shell_exited = False
+        try:
+            await eof
+            shell_exited = True
         except asyncio.CancelledError:
             pass
         finally:
+            with contextlib.suppress(Exception):
+                loop.remove_reader(fd)
+            if pidfd is not None:
+                with contextlib.suppress(Exception):
+                    loop.remove_reader(pidfd)
+                with contextlib.suppress(OSError):
+                    os.close(pidfd)
+            self._flush_output()
             if self._is_active:
                 self._is_active = False
-            if self._child_pid is not None:
-                try:
-                    os.waitpid(self._child_pid, os.WNOHANG)
-                except Exception:
-                    pass
 
-    def _check_child_alive(self) -> bool:
-        if self._child_pid is None:
-            return False
-        try:
-            os.kill(self._child_pid, 0)
-            return True
-        except OSError:
-            return False
+        if shell_exited:
+            # stop() is a no-op once inactive, so release the PTY and reap the shell here.
+            with contextlib.suppress(Exception):
+                await self._stop_unix()
 
     def write(self, data: bytes) -> None:
-        if not self._is_active:
+        """Queue input for the PTY; writes queued in the same loop iteration go out together."""
+        if not self._is_active or not data or self._loop is None:
             return
+        self._write_queue.append(bytes(data))
+        if not self._write_scheduled:
+            self._write_scheduled = True
+            self._loop.call_soon_threadsafe(self._flush_writes)
+
+    def _flush_writes(self) -> None:
+        queue = self._write_queue
         try:
             if IS_WINDOWS:
-                if self._pty_process is not None:
+                if self._pty_process is not None and queue:
+                    # popleft only what was joined; a concurrent write() may append meanwhile.
+                    data = b"".join([queue.popleft() for _ in range(len(queue))])
                     self._pty_process.write(data.decode("utf-8", errors="replace"))
-            else:
-                if self._master_fd is not None:
-                    os.write(self._master_fd, data)
+            elif self._master_fd is not None:
+                while queue:
+                    bufs = list(itertools.islice(queue, _IOV_MAX))
+                    try:
+                        n = os.writev(self._master_fd, bufs)
+                    except BlockingIOError:
+                        break
+                    # Drop fully written buffers; keep the unwritten tail of a partial one.
+                    while n and n >= len(queue[0]):
+                        n -= len(queue.popleft())
+                    if n:
+                        queue[0] = queue[0][n:]
+                        break
         except Exception:
-            pass
+            queue.clear()
+
+        if not IS_WINDOWS and self._master_fd is not None and self._loop is not None:
+            if queue:
+                # PTY input buffer is full (e.g. a large paste): resume when writable.
+                self._loop.add_writer(self._master_fd, self._flush_writes)
+                return
+            self._loop.remove_writer(self._master_fd)
+        self._write_scheduled = False
+        # write() from another thread may have appended after the drain but before the flag reset,
+        # seeing the flag still set; pick that input up rather than stranding it.
+        if queue and self._is_active and self._loop is not None:
+            self._write_scheduled = True
+            self._loop.call_soon(self._flush_writes)
 
     def resize(self, cols: int, rows: int) -> None:
         if not self._is_active:
@@ -377,10 +507,20 @@ class TerminalSession:
                 if self._pty_process.isalive():
                     self._pty_process.kill()
         finally:
+            # Closing the PTY releases the reader thread's blocked read().
+            with contextlib.suppress(Exception):
+                self._pty_process.close(force=True)
             self._pty_process = None
 
     async def _stop_unix(self) -> None:
+        self._write_queue.clear()
+        # A flush parked on add_writer never completes; clear the flag so a restart can write.
+        self._write_scheduled = False
         if self._master_fd is not None:
+            with contextlib.suppress(Exception):
+                asyncio.get_running_loop().remove_reader(self._master_fd)
+            with contextlib.suppress(Exception):
+                asyncio.get_running_loop().remove_writer(self._master_fd)
             with contextlib.suppress(Exception):
                 os.close(self._master_fd)
             self._master_fd = None
@@ -388,7 +528,7 @@ class TerminalSession:
         if self._child_pid is not None:
             try:
                 os.kill(self._child_pid, signal.SIGTERM)
-                await asyncio.sleep(0.1)
+                await asyncio.sleep(0.05)
                 with contextlib.suppress(Exception):
                     os.kill(self._child_pid, signal.SIGKILL)  # type: ignore[attr-defined]
                 with contextlib.suppress(Exception):
@@ -398,66 +538,90 @@ class TerminalSession:
 
 
 _sessions: dict[str, dict[str, TerminalSession]] = {}
-_sessions_lock = threading.Lock()
+# project -> terminal_id -> info; dict insertion order gives list_terminals its ordering.
+_terminal_metadata: dict[str, dict[str, TerminalInfo]] = {}
+# Highest "Terminal N" number handed out per project; monotonic so deleted names aren't reused.
+_terminal_counter: dict[str, int] = {}
+
+# Locks are striped by project so unrelated projects don't contend; a project always
+# maps to the same shard. Must stay a power of two.
+_LOCK_SHARDS = 32
+_session_locks = [threading.Lock() for _ in range(_LOCK_SHARDS)]
+_metadata_locks = [threading.Lock() for _ in range(_LOCK_SHARDS)]
+
+
+def _sessions_lock(project_name: str) -> threading.Lock:
+    return _session_locks[hash(project_name) & (_LOCK_SHARDS - 1)]
+
 
-_terminal_metadata: dict[str, list[TerminalInfo]] = {}
-_metadata_lock = threading.Lock()
+def _metadata_lock(project_name: str) -> threading.Lock:
+    return _metadata_locks[hash(project_name) & (_LOCK_SHARDS - 1)]
+
+
+@contextlib.contextmanager
+def _all_locks(locks: list[threading.Lock]) -> Iterator[None]:
+    # Fixed acquisition order keeps this deadlock-free against per-shard holders.
+    with contextlib.ExitStack() as stack:
+        for lock in locks:
+            stack.enter_context(lock)
+        yield
+
+
+def _note_terminal_name(project_name: str, name: str) -> None:
+    # Keep auto-numbering ahead of user-chosen "Terminal N" names. Caller holds the metadata lock.
+    if name.startswith("Terminal "):
+        with contextlib.suppress(ValueError):
+            n = int(name[len("Terminal ") :])
+            if n > _terminal_counter.get(project_name, 0):
+                _terminal_counter[project_name] = n
 
 
 def create_terminal(project_name: str, name: str | None = None) -> TerminalInfo:
-    with _metadata_lock:
-        terminals = _terminal_metadata.setdefault(project_name, [])
+    with _metadata_lock(project_name):
+        terminals = _terminal_metadata.setdefault(project_name, {})
 
         if name is None or not name.strip():
-            nums: list[int] = []
-            for t in terminals:
-                if t.name.startswith("Terminal "):
-                    with contextlib.suppress(Exception):
-                        nums.append(int(t.name.replace("Terminal ", "")))
-            name = f"Terminal {max(nums, default=0) + 1}"
-
-        terminal_id = str(uuid.uuid4())[:8]
+            n = _terminal_counter.get(project_name, 0) + 1
+            _terminal_counter[project_name] = n
+            name = f"Terminal {n}"
+        else:
+            _note_terminal_name(project_name, name)
+
+        terminal_id = secrets.token_hex(4)
         info = TerminalInfo(id=terminal_id, name=name)
-        terminals.append(info)
+        terminals[terminal_id] = info
         return info
 
 
 def list_terminals(project_name: str) -> list[TerminalInfo]:
-    with _metadata_lock:
-        return list(_terminal_metadata.get(project_name, []))
+    with _metadata_lock(project_name):
+        return list(_terminal_metadata.get(project_name, {}).values())
 
 
 def get_terminal_info(project_name: str, terminal_id: str) -> TerminalInfo | None:
-    with _metadata_lock:
-        for t in _terminal_metadata.get(project_name, []):
-            if t.id == terminal_id:
-                return t
-    return None
+    with _metadata_lock(project_name):
+        return _terminal_metadata.get(project_name, {}).get(terminal_id)
 
 
 def rename_terminal(project_name: str, terminal_id: str, new_name: str) -> bool:
     new_name = (new_name or "").strip()
     if not new_name:
         return False
-    with _metadata_lock:
-        for t in _terminal_metadata.get(project_name, []):
-            if t.id == terminal_id:
-                t.name = new_name
-                return True
-    return False
+    with _metadata_lock(project_name):
+        t = _terminal_metadata.get(project_name, {}).get(terminal_id)
+        if t is None:
+            return False
+        t.name = new_name
+        _note_terminal_name(project_name, new_name)
+        return True
 
 
 def delete_terminal(project_name: str, terminal_id: str) -> bool:
-    with _metadata_lock:
-        terminals = _terminal_metadata.get(project_name, [])
-        for i, t in enumerate(terminals):
-            if t.id == terminal_id:
-                terminals.pop(i)
-                break
-        else:
+    with _metadata_lock(project_name):
+        if _terminal_metadata.get(project_name, {}).pop(terminal_id, None) is None:
             return False
 
-    with _sessions_lock:
+    with _sessions_lock(project_name):
         project_sessions = _sessions.get(project_name, {})
         if terminal_id in project_sessions:
             del project_sessions[terminal_id]
@@ -474,7 +638,7 @@ def get_terminal_session(
         else:
             terminal_id = terminals[0].id
 
-    with _sessions_lock:
+    with _sessions_lock(project_name):
         project_sessions = _sessions.setdefault(project_name, {})
         if terminal_id not in project_sessions:
             project_sessions[terminal_id] = TerminalSession(project_name, project_dir)
@@ -482,23 +646,23 @@ def get_terminal_session(
 
 
 async def stop_terminal_session(project_name: str, terminal_id: str) -> None:
-    with _sessions_lock:
+    with _sessions_lock(project_name):
         session = _sessions.get(project_name, {}).get(terminal_id)
     if session and session.is_active:
         await session.stop()
 
 
 async def cleanup_all_terminals() -> None:
-    with _sessions_lock:
-        sessions = []
-        for project_sessions in _sessions.values():
-            sessions.extend(project_sessions.values())
-        _sessions.clear()
-
-    for s in sessions:
-        with contextlib.suppress(Exception):
-            if s.is_active:
-                await s.stop()
-
-    with _metadata_lock:
+    global _sessions
+    with _all_locks(_session_locks):
+        # Swap in a fresh registry rather than copying every session out of the old one.
+        captured, _sessions = _sessions, {}
+
+    sessions = itertools.chain.from_iterable(d.values() for d in captured.values())
+    # Stop concurrently so shutdown takes one SIGTERM grace period, not one per terminal.
+    await asyncio.gather(*(s.stop() for s in sessions if s.is_active), return_exceptions=True)
+
+    with _all_locks(_metadata_locks):
         _terminal_metadata.clear()
+        _terminal_counter.clear()
+    _get_shell.cache_clear()
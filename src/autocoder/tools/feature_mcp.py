@@ -37,19 +37,30 @@ from pydantic import BaseModel, Field, ValidationError
 # Use the UNIFIED database (shared with Orchestrator)
 from autocoder.core.database import get_database
 
-# Configuration from environment
-PROJECT_DIR = Path(os.environ.get("PROJECT_DIR", ".")).resolve()
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
 
-# Global database instance
-_db = None
 
+def _dumps(obj) -> str:
+    """Serialize a tool result as indented JSON (orjson when installed, else stdlib json)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # a type orjson doesn't know; let json raise or handle it
+    return json.dumps(obj, indent=2)
+
+
+def get_db(project_dir: str | None = None):
+    """
+    Get the unified database instance.
 
-def get_db():
-    """Get the unified database instance."""
-    global _db
-    if _db is None:
-        _db = get_database(str(PROJECT_DIR))
-    return _db
+    Defaults to `PROJECT_DIR` from the environment, read on each call; `get_database` shares
+    instances per DB file, so switching `PROJECT_DIR` needs no module reload.
+    """
+    return get_database(str(Path(project_dir or os.environ.get("PROJECT_DIR", ".")).resolve()))
 
 
 # Pydantic models for input validation
@@ -119,13 +130,11 @@ class DeleteFeatureInput(BaseModel):
 @asynccontextmanager
 async def server_lifespan(server: FastMCP):
     """Initialize database on startup."""
-    global _db
-
     # Create project directory if it doesn't exist
-    PROJECT_DIR.mkdir(parents=True, exist_ok=True)
+    Path(os.environ.get("PROJECT_DIR", ".")).resolve().mkdir(parents=True, exist_ok=True)
 
     # Initialize the unified database
-    _db = get_database(str(PROJECT_DIR))
+    get_db()
 
     yield
 
@@ -159,7 +168,7 @@ def feature_get_stats() -> str:
         "percentage": progress["percentage"]
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -175,7 +184,7 @@ def feature_get_next() -> str:
     feature = db.get_next_pending_feature()
 
     if not feature:
-        return json.dumps({"error": "No pending features available"}, indent=2)
+        return _dumps({"error": "No pending features available"})
 
     # Parse steps from JSON if present
     if feature.get("steps"):
@@ -184,7 +193,7 @@ def feature_get_next() -> str:
         except:
             feature["steps"] = []
 
-    return json.dumps(feature, indent=2)
+    return _dumps(feature)
 
 
 @mcp.tool()
@@ -202,7 +211,7 @@ def feature_claim_next(agent_id: str) -> str:
     feature = db.claim_next_pending_feature(agent_id)
 
     if not feature:
-        return json.dumps({"error": "No pending features available"}, indent=2)
+        return _dumps({"error": "No pending features available"})
 
     if feature.get("steps"):
         try:
@@ -210,7 +219,7 @@ def feature_claim_next(agent_id: str) -> str:
         except Exception:
             feature["steps"] = []
 
-    return json.dumps(feature, indent=2)
+    return _dumps(feature)
 
 
 @mcp.tool()
@@ -234,7 +243,7 @@ def feature_get_for_regression(limit: int = 3) -> str:
             except:
                 feature["steps"] = []
 
-    return json.dumps(features, indent=2)
+    return _dumps(features)
 
 
 @mcp.tool()
@@ -258,7 +267,7 @@ def feature_get_all() -> str:
             except:
                 feature["steps"] = []
 
-    return json.dumps(features, indent=2)
+    return _dumps(features)
 
 
 @mcp.tool()
@@ -275,7 +284,7 @@ def feature_get_by_id(feature_id: int) -> str:
     feature = db.get_feature(feature_id)
 
     if not feature:
-        return json.dumps({"error": f"Feature {feature_id} not found"}, indent=2)
+        return _dumps({"error": f"Feature {feature_id} not found"})
 
     # Parse steps from JSON if present
     if feature.get("steps"):
@@ -284,7 +293,7 @@ def feature_get_by_id(feature_id: int) -> str:
         except:
             feature["steps"] = []
 
-    return json.dumps(feature, indent=2)
+    return _dumps(feature)
 
 
 @mcp.tool()
@@ -320,7 +329,7 @@ def feature_mark_passing(feature_id: int) -> str:
         "message": message,
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -353,13 +362,12 @@ def feature_report_regression(
             error_key=error_key,
         )
     except ValidationError as e:
-        return json.dumps(
+        return _dumps(
             {
                 "success": False,
                 "error": "Invalid feature_report_regression input",
                 "details": e.errors(),
-            },
-            indent=2,
+            }
         )
 
     result = db.create_regression_issue(
@@ -372,7 +380,7 @@ def feature_report_regression(
         artifact_path=str(validated.artifact_path) if validated.artifact_path else None,
         error_key=str(validated.error_key) if validated.error_key else None,
     )
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -394,7 +402,7 @@ def feature_mark_in_progress(feature_id: int) -> str:
         "message": "Feature marked as in-progress" if success else "Failed to mark feature as in-progress"
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -427,7 +435,7 @@ def feature_skip(feature_id: int) -> str:
         "message": "Feature reset to pending" if success else "Failed to skip feature"
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -435,13 +443,12 @@ def feature_clear_in_progress(feature_id: int) -> str:
     """Clear a feature from in-progress back to pending (no attempt increment)."""
     db = get_db()
     success = db.clear_feature_in_progress(feature_id)
-    return json.dumps(
+    return _dumps(
         {
             "success": success,
             "feature_id": feature_id,
             "message": "Feature cleared to pending" if success else "Failed to clear feature",
-        },
-        indent=2,
+        }
     )
 
 
@@ -461,13 +468,12 @@ def feature_create_bulk(features: list[dict]) -> str:
     try:
         validated = BulkCreateInput(features=features)
     except ValidationError as e:
-        return json.dumps(
+        return _dumps(
             {
                 "success": False,
                 "error": "Invalid feature_create_bulk input",
                 "details": e.errors(),
-            },
-            indent=2,
+            }
         )
 
     count = db.create_features_bulk([f.model_dump() for f in validated.features])
@@ -478,7 +484,7 @@ def feature_create_bulk(features: list[dict]) -> str:
         "message": f"Created {count} features"
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -530,7 +536,7 @@ def feature_update(
         params.append(priority)
 
     if not updates:
-        return json.dumps({"error": "No fields to update"}, indent=2)
+        return _dumps({"error": "No fields to update"})
 
     updates.append("updated_at = CURRENT_TIMESTAMP")
     params.append(feature_id)
@@ -551,7 +557,7 @@ def feature_update(
         "message": "Feature updated successfully" if success else "Failed to update feature"
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -578,7 +584,7 @@ def feature_delete(feature_id: int) -> str:
         "message": "Feature deleted successfully" if success else "Failed to delete feature"
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 if __name__ == "__main__":
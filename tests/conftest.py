@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """`AUTOCODER_TEST_FAST=1` skips `@pytest.mark.integration` tests (the ones that run git) for local loops."""
+    if not os.getenv("AUTOCODER_TEST_FAST"):
+        return
+    skip = pytest.mark.skip(reason="AUTOCODER_TEST_FAST=1 skips integration tests")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolate_home(tmp_path_factory: pytest.TempPathFactory):
+    """
+    Point HOME/USERPROFILE at a per-session temp dir so nothing writes to the developer's real
+    `~/.autocoder` (knowledge.db, settings, registry) and every run starts from empty state.
+
+    With no global gitconfig left, a fixed git identity comes from the environment so test repos
+    can commit without per-repo `git config` calls.
+    """
+    home = tmp_path_factory.mktemp("home")
+    mp = pytest.MonkeyPatch()
+    mp.setenv("HOME", str(home))
+    mp.setenv("USERPROFILE", str(home))
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        mp.setenv(var, "Test User")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        mp.setenv(var, "test@test.com")
+    yield home
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def _git_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A committed repo (README.md on `main`) built once per session; copy it, don't mutate it."""
+    repo = tmp_path_factory.mktemp("git-template") / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "-c", "init.defaultBranch=main", "init", "-q"], cwd=repo, check=True)
+
+    (repo / "README.md").write_text("# Test Repo", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=repo, stdout=subprocess.DEVNULL, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "Initial commit"], cwd=repo, check=True)
+    return repo
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path, _git_template: Path) -> Path:
+    """A fresh copy of the session git template at `tmp_path / "repo"`."""
+    dst = tmp_path / "repo"
+    shutil.copytree(_git_template, dst)
+    return dst
+
+
+@pytest.fixture(scope="session")
+def kb(_isolate_home: Path):
+    """One KnowledgeBase (schema created once) backed by the isolated home's knowledge.db."""
+    from autocoder.core.knowledge_base import KnowledgeBase
+
+    return KnowledgeBase()
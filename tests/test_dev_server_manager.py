@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 from pathlib import Path
 
-from autocoder.server.services.dev_server_manager import detect_dev_command, extract_url
+import pytest
+
+from autocoder.server.services.dev_server_manager import (
+    DevServerManager,
+    build_popen_args,
+    detect_dev_command,
+    extract_url,
+)
 
 
 def _write_pkg(tmp_path: Path, scripts: dict[str, str]) -> None:
@@ -37,3 +46,98 @@ def test_detect_dev_command_from_package_json(tmp_path: Path) -> None:
     _write_pkg(tmp2, {"start": "node server.js"})
     assert detect_dev_command(tmp2) == "npm start"
 
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows always launches through the shell")
+def test_build_popen_args_avoids_shell_for_simple_commands() -> None:
+    assert build_popen_args("npm run dev") == (["npm", "run", "dev"], False)
+    assert build_popen_args("pnpm dev --port 5173") == (["pnpm", "dev", "--port", "5173"], False)
+
+    assert build_popen_args("npm run build && npm start") == ("npm run build && npm start", True)
+    assert build_popen_args("PORT=3000 npm start") == ("PORT=3000 npm start", True)
+    assert build_popen_args("echo $HOME") == ("echo $HOME", True)
+    assert build_popen_args("npm run dev # local only") == ("npm run dev # local only", True)
+
+
+async def test_output_queue_drops_oldest_and_keeps_order(tmp_path: Path) -> None:
+    mgr = DevServerManager("p", tmp_path)
+    mgr._output_queue = asyncio.Queue(maxsize=3)
+    for i in range(5):
+        mgr._enqueue_output(f"line {i}")
+    mgr._enqueue_output(None)
+    assert mgr.dropped_lines == 3
+
+    seen: list[str] = []
+
+    async def cb(line: str) -> None:
+        seen.append(line)
+
+    mgr.add_output_callback(cb)
+    await mgr._dispatch_output(mgr._output_queue)
+    assert seen == ["line 3", "line 4"]
+    assert mgr.get_status_dict()["dropped_lines"] == 3
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX process groups only")
+def test_exit_hook_kills_dev_servers_left_running(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import subprocess
+
+    from autocoder.server.services import dev_server_manager
+
+    mgr = DevServerManager("p", tmp_path)
+    mgr.process = subprocess.Popen(["sleep", "30"], start_new_session=True)
+    monkeypatch.setattr(dev_server_manager, "_dev_managers", {"p": mgr})
+    try:
+        dev_server_manager._kill_remaining_dev_servers()
+        assert mgr.process.wait(timeout=5) != 0
+    finally:
+        if mgr.process.poll() is None:
+            mgr.process.kill()
+
+
+def _run_with_slow_subscriber(mgr: DevServerManager, script: str) -> list[tuple[str, str]]:
+    import subprocess
+
+    events: list[tuple[str, str]] = []
+
+    async def on_line(line: str) -> None:
+        await asyncio.sleep(0.02)  # slow subscriber: lines pile up in the queue
+        events.append(("line", line))
+
+    async def on_status(status: str) -> None:
+        events.append(("status", status))
+
+    mgr.add_output_callback(on_line)
+    mgr.add_status_callback(on_status)
+    mgr.process = subprocess.Popen(
+        ["sh", "-c", script], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, start_new_session=True
+    )
+    mgr.status = "running"
+    mgr._output_queue = asyncio.Queue(maxsize=mgr.OUTPUT_QUEUE_SIZE)
+    mgr._dispatch_task = asyncio.create_task(mgr._dispatch_output(mgr._output_queue))
+    mgr._output_task = asyncio.create_task(mgr._stream_output())
+    return events
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX process groups only")
+async def test_last_lines_arrive_before_exit_status(tmp_path: Path) -> None:
+    mgr = DevServerManager("p", tmp_path)
+    events = _run_with_slow_subscriber(mgr, "for i in 1 2 3 4 5; do echo line $i; done; exit 1")
+    await mgr._output_task
+    await asyncio.sleep(0.05)
+    assert events == [("status", "running")] + [("line", f"line {i}") for i in range(1, 6)] + [
+        ("status", "crashed")
+    ]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX process groups only")
+async def test_stop_flushes_buffered_lines_before_stopped_status(tmp_path: Path) -> None:
+    mgr = DevServerManager("p", tmp_path)
+    events = _run_with_slow_subscriber(mgr, "echo a; echo b; echo c; exec sleep 30")
+    deadline = asyncio.get_running_loop().time() + 5
+    while len(mgr.tail()) < 3 and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.01)
+
+    ok, _ = await mgr.stop()
+    assert ok
+    await asyncio.sleep(0.05)
+    assert events[1:] == [("line", "a"), ("line", "b"), ("line", "c"), ("status", "stopped")]
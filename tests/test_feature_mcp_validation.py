@@ -12,49 +12,50 @@ class _DummyDB:
         return len(features)
 
 
-def test_feature_create_bulk_rejects_invalid_items():
+def test_feature_create_bulk_rejects_invalid_items(monkeypatch):
     dummy = _DummyDB()
-    original = feature_mcp._db
-    feature_mcp._db = dummy
-    try:
-        out = feature_mcp.feature_create_bulk(
-            [
-                {
-                    "category": "",
-                    "name": "Valid name",
-                    "description": "ok",
-                    "steps": ["step 1"],
-                }
-            ]
-        )
-        payload = json.loads(out)
-        assert payload["success"] is False
-        assert dummy.created is None
-    finally:
-        feature_mcp._db = original
-
-
-def test_feature_create_bulk_applies_defaults_and_calls_db():
+    monkeypatch.setattr(feature_mcp, "get_db", lambda: dummy)
+    out = feature_mcp.feature_create_bulk(
+        [
+            {
+                "category": "",
+                "name": "Valid name",
+                "description": "ok",
+                "steps": ["step 1"],
+            }
+        ]
+    )
+    payload = json.loads(out)
+    assert payload["success"] is False
+    assert dummy.created is None
+
+
+def test_feature_create_bulk_applies_defaults_and_calls_db(monkeypatch):
     dummy = _DummyDB()
-    original = feature_mcp._db
-    feature_mcp._db = dummy
-    try:
-        out = feature_mcp.feature_create_bulk(
-            [
-                {
-                    "category": "core",
-                    "name": "Some feature",
-                    "description": "Do the thing",
-                    "steps": ["step 1"],
-                }
-            ]
-        )
-        payload = json.loads(out)
-        assert payload["success"] is True
-        assert payload["created"] == 1
-        assert dummy.created is not None
-        assert dummy.created[0]["priority"] == 0
-        assert dummy.created[0]["enabled"] is True
-    finally:
-        feature_mcp._db = original
+    monkeypatch.setattr(feature_mcp, "get_db", lambda: dummy)
+    out = feature_mcp.feature_create_bulk(
+        [
+            {
+                "category": "core",
+                "name": "Some feature",
+                "description": "Do the thing",
+                "steps": ["step 1"],
+            }
+        ]
+    )
+    payload = json.loads(out)
+    assert payload["success"] is True
+    assert payload["created"] == 1
+    assert dummy.created is not None
+    assert dummy.created[0]["priority"] == 0
+    assert dummy.created[0]["enabled"] is True
+
+
+def test_tool_output_falls_back_to_stdlib_json_without_orjson(monkeypatch):
+    monkeypatch.setattr(feature_mcp, "orjson", None)
+    assert json.loads(feature_mcp._dumps({"a": [1, 2]})) == {"a": [1, 2]}
 
+    dummy = _DummyDB()
+    monkeypatch.setattr(feature_mcp, "get_db", lambda: dummy)
+    payload = json.loads(feature_mcp.feature_create_bulk([{"category": ""}]))
+    assert payload["success"] is False
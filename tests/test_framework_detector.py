@@ -9,161 +9,81 @@ to run the correct test commands for any project.
 Run with: pytest tests/test_framework_detector.py -v
 """
 
-import tempfile
 import json
 from pathlib import Path
 
-from autocoder.core.test_framework_detector import TestFrameworkDetector
+import pytest
 
+from autocoder.core.test_framework_detector import TestFrameworkDetector
 
-def test_detect_jest():
-    """Test detecting Jest framework."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
 
-        # Create package.json with jest
-        package_json = {
-            "name": "test-project",
-            "scripts": {
-                "test": "jest",
-                "test:watch": "jest --watch"
+JEST_PACKAGE_JSON = json.dumps(
+    {
+        "name": "test-project",
+        "scripts": {"test": "jest", "test:watch": "jest --watch"},
+        "devDependencies": {"jest": "^29.0.0"},
+    }
+).encode()
+VITEST_PACKAGE_JSON = json.dumps(
+    {
+        "name": "test-project",
+        "scripts": {"test": "vitest"},
+        "devDependencies": {"vitest": "^1.0.0"},
+    }
+).encode()
+PYTEST_REQUIREMENTS = b"pytest\n"
+PYTEST_INI = b"[pytest]\ntestpaths = tests"
+
+
+@pytest.mark.parametrize(
+    ("layout", "expected", "command_hint"),
+    [
+        pytest.param({"package.json": JEST_PACKAGE_JSON}, "jest", "npm test", id="jest"),
+        pytest.param({"package.json": VITEST_PACKAGE_JSON}, "vitest", "npm test", id="vitest"),
+        pytest.param(
+            {
+                "requirements.txt": PYTEST_REQUIREMENTS,
+                "pytest.ini": PYTEST_INI,
+                "tests/test_example.py": b"def test_something(): pass",
             },
-            "devDependencies": {
-                "jest": "^29.0.0"
-            }
-        }
-
-        (project_path / "package.json").write_text(json.dumps(package_json))
-
-        # Detect
-        detector = TestFrameworkDetector(str(project_path))
-        framework = detector.get_framework_info()
-
-        assert framework["framework"] == "jest", "Should detect Jest"
-        assert "npm test" in framework["test_command"], "Should have npm test command"
-        print("✅ Jest detection works")
-
-
-def test_detect_pytest():
-    """Test detecting pytest framework."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-
-        # Create requirements.txt (marks as Python project)
-        (project_path / "requirements.txt").write_text("pytest\n")
-
-        # Create pytest.ini
-        (project_path / "pytest.ini").write_text("[pytest]\ntestpaths = tests")
-
-        # Create a test file
-        tests_dir = project_path / "tests"
-        tests_dir.mkdir()
-        (tests_dir / "test_example.py").write_text("def test_something(): pass")
-
-        # Detect
-        detector = TestFrameworkDetector(str(project_path))
-        framework = detector.get_framework_info()
-
-        assert framework["framework"] == "pytest", "Should detect pytest"
-        assert "pytest" in framework["test_command"], "Should have pytest command"
-        print("✅ Pytest detection works")
-
-
-def test_detect_vitest():
-    """Test detecting Vitest framework."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-
-        # Create package.json with vitest
-        package_json = {
-            "name": "test-project",
-            "scripts": {
-                "test": "vitest"
+            "pytest",
+            "pytest",
+            id="pytest-ini",
+        ),
+        pytest.param(
+            {
+                "requirements.txt": PYTEST_REQUIREMENTS,
+                "tests/test_auth.py": b"def test_login(): pass",
+                "tests/test_users.py": b"def test_create_user(): pass",
             },
-            "devDependencies": {
-                "vitest": "^1.0.0"
-            }
-        }
-
-        (project_path / "package.json").write_text(json.dumps(package_json))
-
-        # Detect
-        detector = TestFrameworkDetector(str(project_path))
-        framework = detector.get_framework_info()
-
-        assert framework["framework"] == "vitest", "Should detect Vitest"
-        assert "npm test" in framework["test_command"], "Should have npm test command"
-        print("✅ Vitest detection works")
-
-
-def test_detect_no_framework():
-    """Test project with no test framework."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-
-        # Create empty project
-        (project_path / "README.md").write_text("# No tests here")
-
-        # Detect
-        detector = TestFrameworkDetector(str(project_path))
-        framework = detector.get_framework_info()
-
-        assert framework["framework"] == "unknown", "Should return unknown for no framework"
-        print("✅ Unknown framework detection works")
-
-
-def test_detect_with_test_files():
-    """Test detection based on test file patterns."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-
-        # Create requirements.txt to mark as Python
-        (project_path / "requirements.txt").write_text("pytest\n")
-
-        # Create Python test files
-        tests_dir = project_path / "tests"
-        tests_dir.mkdir()
-        (tests_dir / "test_auth.py").write_text("def test_login(): pass")
-        (tests_dir / "test_users.py").write_text("def test_create_user(): pass")
-
-        # Detect
-        detector = TestFrameworkDetector(str(project_path))
-        framework = detector.get_framework_info()
-
-        assert framework["framework"] == "pytest", "Should detect pytest from test files"
-        print("✅ Test file pattern detection works")
-
-
-def test_get_framework_info():
-    """Test getting framework info."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-
-        # Create requirements.txt
-        (project_path / "requirements.txt").write_text("pytest\n")
-
-        # Create pytest.ini
-        (project_path / "pytest.ini").write_text("[pytest]")
-
-        # Use detector
-        detector = TestFrameworkDetector(str(project_path))
-        framework = detector.get_framework_info()
-
-        assert framework is not None, "Should return a framework"
-        assert framework["framework"] == "pytest", "Should detect pytest"
-        print("✅ Get framework info works")
+            "pytest",
+            "pytest",
+            id="pytest-test-files",
+        ),
+        pytest.param(
+            {"requirements.txt": PYTEST_REQUIREMENTS, "pytest.ini": b"[pytest]"},
+            "pytest",
+            "pytest",
+            id="pytest-bare-ini",
+        ),
+        pytest.param({"README.md": b"# No tests here"}, "unknown", None, id="no-framework"),
+    ],
+)
+def test_detect_framework(tmp_path: Path, layout: dict[str, bytes], expected: str, command_hint: str | None):
+    """Each project layout is detected as the expected framework with a matching test command."""
+    for rel, content in layout.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+    framework = TestFrameworkDetector(str(tmp_path)).get_framework_info()
+
+    assert framework["framework"] == expected
+    if command_hint is not None:
+        assert command_hint in framework["test_command"]
 
 
 if __name__ == "__main__":
-    print("Running Test Framework Detector Tests...\n")
-
-    test_detect_jest()
-    test_detect_pytest()
-    test_detect_vitest()
-    test_detect_no_framework()
-    test_detect_with_test_files()
-    test_get_framework_info()
+    import sys
 
-    print("\n" + "=" * 70)
-    print("ALL TEST FRAMEWORK DETECTOR TESTS PASSED ✅")
-    print("=" * 70)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -1,27 +1,32 @@
 import json
+import sqlite3
 from pathlib import Path
 
 from autocoder.core.global_settings_db import get_global_setting_json
 from autocoder.server.settings_store import AdvancedSettings, load_advanced_settings, save_advanced_settings
 
 
-def test_advanced_settings_roundtrip_sqlite(tmp_path, monkeypatch):
-    db_path = tmp_path / "settings.db"
-    monkeypatch.setenv("AUTOCODER_SETTINGS_DB_PATH", str(db_path))
+def test_advanced_settings_roundtrip_sqlite(monkeypatch):
+    uri = "file:advanced-settings-roundtrip?mode=memory&cache=shared"
+    monkeypatch.setenv("AUTOCODER_SETTINGS_DB_PATH", uri)
+    # A shared in-memory DB lives only while a connection is open; hold one for the test.
+    keepalive = sqlite3.connect(uri, uri=True)
+    try:
+        s = AdvancedSettings(
+            review_enabled=True,
+            review_mode="gate",
+            api_port_range_start=6000,
+            api_port_range_end=6010,
+        )
+        save_advanced_settings(s)
 
-    s = AdvancedSettings(
-        review_enabled=True,
-        review_mode="gate",
-        api_port_range_start=6000,
-        api_port_range_end=6010,
-    )
-    save_advanced_settings(s)
-
-    loaded = load_advanced_settings()
-    assert loaded.review_enabled is True
-    assert loaded.review_mode == "gate"
-    assert loaded.api_port_range_start == 6000
-    assert loaded.api_port_range_end == 6010
+        loaded = load_advanced_settings()
+        assert loaded.review_enabled is True
+        assert loaded.review_mode == "gate"
+        assert loaded.api_port_range_start == 6000
+        assert loaded.api_port_range_end == 6010
+    finally:
+        keepalive.close()
 
 
 def test_advanced_settings_migrates_from_legacy_json_once(tmp_path, monkeypatch):
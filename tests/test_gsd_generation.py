@@ -7,9 +7,11 @@ import pytest
 from autocoder.generation.gsd import build_gsd_to_spec_prompt, get_gsd_status
 
 
-def _write(p: Path, text: str) -> None:
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(text, encoding="utf-8")
+@pytest.fixture
+def codebase_dir(tmp_path: Path) -> Path:
+    base = tmp_path / ".planning" / "codebase"
+    base.mkdir(parents=True)
+    return base
 
 
 def test_gsd_status_missing(tmp_path: Path) -> None:
@@ -18,11 +20,10 @@ def test_gsd_status_missing(tmp_path: Path) -> None:
     assert set(st.missing) == {"ARCHITECTURE.md", "STACK.md", "STRUCTURE.md"}
 
 
-def test_build_gsd_prompt(tmp_path: Path) -> None:
-    base = tmp_path / ".planning" / "codebase"
-    _write(base / "STACK.md", "Node + React")
-    _write(base / "ARCHITECTURE.md", "Layers...")
-    _write(base / "STRUCTURE.md", "src/ ...")
+def test_build_gsd_prompt(tmp_path: Path, codebase_dir: Path) -> None:
+    (codebase_dir / "STACK.md").write_text("Node + React", encoding="utf-8")
+    (codebase_dir / "ARCHITECTURE.md").write_text("Layers...", encoding="utf-8")
+    (codebase_dir / "STRUCTURE.md").write_text("src/ ...", encoding="utf-8")
 
     prompt = build_gsd_to_spec_prompt(tmp_path)
     assert "GSD mapping docs" in prompt
@@ -31,14 +32,12 @@ def test_build_gsd_prompt(tmp_path: Path) -> None:
     assert "STRUCTURE.md" in prompt
 
     # Optional file included when present
-    _write(base / "CONVENTIONS.md", "Use prettier")
+    (codebase_dir / "CONVENTIONS.md").write_text("Use prettier", encoding="utf-8")
     prompt2 = build_gsd_to_spec_prompt(tmp_path)
     assert "CONVENTIONS.md" in prompt2
 
 
-def test_build_gsd_prompt_raises_when_missing_required(tmp_path: Path) -> None:
-    base = tmp_path / ".planning" / "codebase"
-    _write(base / "STACK.md", "x")
+def test_build_gsd_prompt_raises_when_missing_required(tmp_path: Path, codebase_dir: Path) -> None:
+    (codebase_dir / "STACK.md").write_text("x", encoding="utf-8")
     with pytest.raises(FileNotFoundError):
         build_gsd_to_spec_prompt(tmp_path)
-
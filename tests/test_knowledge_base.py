@@ -9,16 +9,11 @@ previous implementations and share patterns.
 Run with: pytest tests/test_knowledge_base.py -v
 """
 
-from pathlib import Path
+import pytest
 
-from autocoder.core.knowledge_base import KnowledgeBase
 
-
-def test_knowledge_base_store_and_retrieve():
+def test_knowledge_base_store_and_retrieve(kb):
     """Test storing and retrieving patterns from knowledge base."""
-    # Note: KnowledgeBase uses global ~/.autocoder/knowledge.db for cross-project learning
-    kb = KnowledgeBase()
-
     # Store a pattern
     feature = {
         "category": "test_authentication",
@@ -53,45 +48,36 @@ def test_knowledge_base_store_and_retrieve():
     })
     assert isinstance(similar, list), "Should return a list"
 
-    print("✅ Knowledge base store and retrieve works")
-
 
-def test_knowledge_base_model_learning():
+def test_knowledge_base_model_learning(kb):
     """Test that knowledge base learns which models work best."""
-    kb = KnowledgeBase()
-
-    # Store successful implementations with different models
-    for i in range(3):
-        feature = {
-            "category": "test_model_learning",
-            "name": f"auth feature {i}",
-            "description": "Authentication feature"
+    # Store successful implementations with different models, in one batch
+    kb.store_patterns([
+        {
+            "feature": {
+                "category": "test_model_learning",
+                "name": f"auth feature {i}",
+                "description": "Authentication feature"
+            },
+            "implementation": {
+                "approach": "JWT auth",
+                "files_changed": ["src/auth.ts"],
+                "model_used": "claude-opus-4-5"
+            },
+            "success": True,
+            "attempts": 1,
+            "lessons_learned": "Opus works best for auth",
         }
-
-        implementation = {
-            "approach": "JWT auth",
-            "files_changed": ["src/auth.ts"],
-            "model_used": "claude-opus-4-5"
-        }
-
-        kb.store_pattern(
-            feature=feature,
-            implementation=implementation,
-            success=True,
-            attempts=1,
-            lessons_learned="Opus works best for auth"
-        )
+        for i in range(3)
+    ])
 
     # Get recommended model
     model = kb.get_best_model("test_model_learning")
     assert model == "claude-opus-4-5", "Should recommend Opus for test category"
-    print("✅ Knowledge base model learning works")
 
 
-def test_knowledge_base_reference_generation():
+def test_knowledge_base_reference_generation(kb):
     """Test generating reference prompts from past work."""
-    kb = KnowledgeBase()
-
     # Store a successful pattern
     feature = {
         "category": "test_reference",
@@ -122,52 +108,40 @@ def test_knowledge_base_reference_generation():
 
     assert isinstance(reference, str), "Should return a string"
     assert len(reference) > 0, "Should not be empty"
-    print("✅ Knowledge base reference generation works")
 
 
-def test_knowledge_base_categories():
+def test_knowledge_base_categories(kb):
     """Test getting statistics by category."""
-    kb = KnowledgeBase()
-
     # Store patterns in different categories
     categories = ["test_cat1", "test_cat2", "test_cat3", "test_cat2"]
-    for i, cat in enumerate(categories):
-        feature = {
-            "category": cat,
-            "name": f"feature {i}",
-            "description": f"{cat} feature"
-        }
-
-        implementation = {
-            "approach": "Test approach",
-            "files_changed": ["file.ts"],
-            "model_used": "claude-opus-4-5"
+    ids = kb.store_patterns([
+        {
+            "feature": {
+                "category": cat,
+                "name": f"feature {i}",
+                "description": f"{cat} feature"
+            },
+            "implementation": {
+                "approach": "Test approach",
+                "files_changed": ["file.ts"],
+                "model_used": "claude-opus-4-5"
+            },
+            "success": True,
+            "attempts": 1,
+            "lessons_learned": f"Lesson for {cat}",
         }
-
-        kb.store_pattern(
-            feature=feature,
-            implementation=implementation,
-            success=True,
-            attempts=1,
-            lessons_learned=f"Lesson for {cat}"
-        )
+        for i, cat in enumerate(categories)
+    ])
+    assert len(set(ids)) == len(categories), "Should return one id per stored pattern"
 
     # Get summary
     summary = kb.get_summary()
     assert summary["total_patterns"] > 0, "Should have patterns"
     assert "test_cat2" in summary["by_category"], "Should have test_cat2 category"
     assert summary["by_category"]["test_cat2"] >= 2, "Should have at least 2 test_cat2 patterns"
-    print("✅ Knowledge base summary works")
 
 
 if __name__ == "__main__":
-    print("Running Knowledge Base Tests...\n")
-
-    test_knowledge_base_store_and_retrieve()
-    test_knowledge_base_model_learning()
-    test_knowledge_base_reference_generation()
-    test_knowledge_base_categories()
+    import sys
 
-    print("\n" + "=" * 70)
-    print("ALL KNOWLEDGE BASE TESTS PASSED ✅")
-    print("=" * 70)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -10,22 +10,19 @@ import autocoder.core.orchestrator as orchestrator_module
 
 def _init_git_repo(repo_path: Path) -> None:
     repo_path.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "init"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(["git", "checkout", "-b", "main"], cwd=repo_path, capture_output=True, check=True)
+    subprocess.run(["git", "-c", "init.defaultBranch=main", "init", "-q"], cwd=repo_path, check=True)
 
     (repo_path / "README.md").write_text("# Test Repo", encoding="utf-8")
-    subprocess.run(["git", "add", "."], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=repo_path, capture_output=True, check=True)
+    subprocess.run(["git", "add", "."], cwd=repo_path, stdout=subprocess.DEVNULL, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "Initial commit"], cwd=repo_path, check=True)
 
 
 def _create_feature_branch_with_commit(repo_path: Path, branch: str) -> None:
-    subprocess.run(["git", "checkout", "-b", branch], cwd=repo_path, capture_output=True, check=True)
+    subprocess.run(["git", "checkout", "-b", branch], cwd=repo_path, stdout=subprocess.DEVNULL, check=True)
     (repo_path / "A.txt").write_text("a", encoding="utf-8")
-    subprocess.run(["git", "add", "A.txt"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(["git", "commit", "-m", "feat"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(["git", "checkout", "main"], cwd=repo_path, capture_output=True, check=True)
+    subprocess.run(["git", "add", "A.txt"], cwd=repo_path, stdout=subprocess.DEVNULL, check=True)
+    subprocess.run(["git", "commit", "-m", "feat"], cwd=repo_path, stdout=subprocess.DEVNULL, check=True)
+    subprocess.run(["git", "checkout", "main"], cwd=repo_path, stdout=subprocess.DEVNULL, check=True)
 
 
 def test_salvage_dead_agent_marks_ready_for_verification(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import subprocess
-import tempfile
+import shutil
 from pathlib import Path
 
 import pytest
@@ -9,28 +8,28 @@ import pytest
 from autocoder.core.orchestrator import Orchestrator
 
 
-def _init_git_repo(repo_path: Path) -> None:
-    repo_path.mkdir(parents=True, exist_ok=True)
-    subprocess.run(["git", "init"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(["git", "checkout", "-b", "main"], cwd=repo_path, capture_output=True, check=True)
+@pytest.fixture(scope="class")
+def orch_and_repo(tmp_path_factory: pytest.TempPathFactory, _git_template: Path):
+    """One Orchestrator over one repo copy; each test uses its own worktree dir and feature id."""
+    repo_path = tmp_path_factory.mktemp("planner") / "repo"
+    shutil.copytree(_git_template, repo_path)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AUTOCODER_SKIP_PORT_CHECK", "1")
+        mp.setenv("AUTOCODER_PLANNER_REQUIRED", "1")
+        # Keep planner enabled off; required should still ensure a plan for risky features (fail-open).
+        mp.delenv("AUTOCODER_PLANNER_ENABLED", raising=False)
+        yield Orchestrator(project_dir=str(repo_path), max_agents=0), repo_path
 
-    (repo_path / "README.md").write_text("# Test Repo", encoding="utf-8")
-    subprocess.run(["git", "add", "."], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=repo_path, capture_output=True, check=True)
 
+class TestPlannerRequired:
+    @staticmethod
+    def _worktree(repo_path: Path, feature_id: int) -> Path:
+        worktree = repo_path / "worktrees" / f"agent-{feature_id}"
+        worktree.mkdir(parents=True, exist_ok=True)
+        return worktree
 
-def test_planner_required_writes_fallback_plan(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("AUTOCODER_SKIP_PORT_CHECK", "1")
-    monkeypatch.setenv("AUTOCODER_PLANNER_REQUIRED", "1")
-    # Keep planner enabled off; required should still ensure a plan for risky features (fail-open).
-    monkeypatch.delenv("AUTOCODER_PLANNER_ENABLED", raising=False)
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_path = Path(tmpdir) / "repo"
-        _init_git_repo(repo_path)
-        orch = Orchestrator(project_dir=str(repo_path), max_agents=0)
+    def test_writes_fallback_plan(self, monkeypatch: pytest.MonkeyPatch, orch_and_repo) -> None:
+        orch, repo_path = orch_and_repo
 
         # Force the planner to be unavailable so the deterministic fallback is exercised,
         # regardless of local machine credentials/CLIs.
@@ -42,9 +41,6 @@ def test_planner_required_writes_fallback_plan(monkeypatch: pytest.MonkeyPatch)
             lambda: (MultiModelGenerateConfig(agents=[], synthesizer="none", timeout_s=1), False, "forced"),
         )
 
-        worktree = repo_path / "worktrees" / "agent-1"
-        worktree.mkdir(parents=True, exist_ok=True)
-
         feature = {
             "id": 123,
             "name": "Add auth middleware",
@@ -54,7 +50,7 @@ def test_planner_required_writes_fallback_plan(monkeypatch: pytest.MonkeyPatch)
             "attempts": 0,
         }
 
-        plan_path = orch._ensure_feature_plan(feature=feature, worktree_path=worktree)
+        plan_path = orch._ensure_feature_plan(feature=feature, worktree_path=self._worktree(repo_path, 123))
         assert plan_path is not None
         p = Path(plan_path)
         assert p.exists()
@@ -62,19 +58,8 @@ def test_planner_required_writes_fallback_plan(monkeypatch: pytest.MonkeyPatch)
         assert "Feature plan (fallback)" in text
         assert "Reason:" in text
 
-
-def test_planner_required_smart_skips_low_risk(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("AUTOCODER_SKIP_PORT_CHECK", "1")
-    monkeypatch.setenv("AUTOCODER_PLANNER_REQUIRED", "1")
-    monkeypatch.delenv("AUTOCODER_PLANNER_ENABLED", raising=False)
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_path = Path(tmpdir) / "repo"
-        _init_git_repo(repo_path)
-        orch = Orchestrator(project_dir=str(repo_path), max_agents=0)
-
-        worktree = repo_path / "worktrees" / "agent-1"
-        worktree.mkdir(parents=True, exist_ok=True)
+    def test_smart_skips_low_risk(self, orch_and_repo) -> None:
+        orch, repo_path = orch_and_repo
 
         feature = {
             "id": 1,
@@ -85,22 +70,11 @@ def test_planner_required_smart_skips_low_risk(monkeypatch: pytest.MonkeyPatch)
             "attempts": 0,
         }
 
-        plan_path = orch._ensure_feature_plan(feature=feature, worktree_path=worktree)
+        plan_path = orch._ensure_feature_plan(feature=feature, worktree_path=self._worktree(repo_path, 1))
         assert plan_path is None
 
-
-def test_planner_required_smart_triggers_after_failure(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("AUTOCODER_SKIP_PORT_CHECK", "1")
-    monkeypatch.setenv("AUTOCODER_PLANNER_REQUIRED", "1")
-    monkeypatch.delenv("AUTOCODER_PLANNER_ENABLED", raising=False)
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_path = Path(tmpdir) / "repo"
-        _init_git_repo(repo_path)
-        orch = Orchestrator(project_dir=str(repo_path), max_agents=0)
-
-        worktree = repo_path / "worktrees" / "agent-1"
-        worktree.mkdir(parents=True, exist_ok=True)
+    def test_smart_triggers_after_failure(self, orch_and_repo) -> None:
+        orch, repo_path = orch_and_repo
 
         feature = {
             "id": 2,
@@ -111,6 +85,5 @@ def test_planner_required_smart_triggers_after_failure(monkeypatch: pytest.Monke
             "attempts": 2,
         }
 
-        plan_path = orch._ensure_feature_plan(feature=feature, worktree_path=worktree)
+        plan_path = orch._ensure_feature_plan(feature=feature, worktree_path=self._worktree(repo_path, 2))
         assert plan_path is not None
-
@@ -93,3 +93,48 @@ def test_synthesize_node_commands_keeps_test_script(tmp_path: Path):
     cmds = synthesize_commands_from_preset("node-npm", tmp_path)
     assert "test" in cmds and cmds["test"] is not None
     assert cmds["test"].command == "npm test"
+
+
+def test_load_project_config_reuses_json_cache_until_yaml_changes(tmp_path: Path):
+    import os
+
+    from autocoder.core.project_config import _yaml_cache_path
+
+    cfg_path = tmp_path / "autocoder.yaml"
+    cfg_path.write_text("preset: python-uv\n", encoding="utf-8")
+    assert load_project_config(tmp_path).preset == "python-uv"
+    cache_path = _yaml_cache_path(cfg_path)
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["data"] == {"preset": "python-uv"}
+
+    # A changed file (different size, same mtime) must be re-parsed, not served from the cache.
+    st = cfg_path.stat()
+    cfg_path.write_text("preset: node-npm\n", encoding="utf-8")
+    os.utime(cfg_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert load_project_config(tmp_path).preset == "node-npm"
+
+
+def test_json_cache_keeps_only_recent_sidecars(tmp_path: Path, monkeypatch):
+    import autocoder.core.project_config as project_config
+
+    monkeypatch.setattr(project_config, "_YAML_CACHE_MAX_FILES", 2)
+    paths = []
+    for i in range(4):
+        project = tmp_path / f"p{i}"
+        project.mkdir()
+        (project / "autocoder.yaml").write_text("preset: python-uv\n", encoding="utf-8")
+        assert load_project_config(project).preset == "python-uv"
+        paths.append(project_config._yaml_cache_path(project / "autocoder.yaml"))
+
+    assert len(list(paths[0].parent.glob("*.json"))) == 2
+    assert paths[-1].exists()
+
+
+def test_load_project_config_survives_unusable_cache_location(tmp_path: Path, monkeypatch):
+    import autocoder.core.project_config as project_config
+
+    def _no_home(path: Path) -> Path:
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(project_config, "_yaml_cache_path", _no_home)
+    (tmp_path / "autocoder.yaml").write_text("preset: python-uv\n", encoding="utf-8")
+    assert load_project_config(tmp_path).preset == "python-uv"
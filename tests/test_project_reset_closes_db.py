@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from autocoder.core.database import get_database
+from autocoder.server.routers import projects
+
+
+def test_reset_project_closes_pooled_db_before_unlinking(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("AUTOCODER_SQLITE_POOL", raising=False)
+    monkeypatch.delenv("AUTOCODER_SQLITE_EXCLUSIVE", raising=False)
+    monkeypatch.setattr(
+        projects, "_get_registry_functions", lambda: (None, None, lambda name: tmp_path, None, None)
+    )
+
+    db = get_database(str(tmp_path))
+    with db.get_connection() as conn:
+        conn.execute("SELECT 1")
+
+    result = asyncio.run(projects.reset_project("demo"))
+    assert result["success"] is True
+    assert not (tmp_path / "agent_system.db").exists()
+
+    # The pooled handle was closed (not left pointing at the unlinked file) and the cache evicted.
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    assert get_database(str(tmp_path)) is not db
@@ -1,19 +1,17 @@
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
 
-from autocoder.qa_worker import _apply_patch, _strip_fences, _trim_to_diff_start
+import pytest
 
+from autocoder.qa_worker import _apply_patch, _strip_fences, _trim_to_diff_start
 
-def _init_git_repo(repo: Path) -> None:
-    import subprocess
 
-    subprocess.run(["git", "init"], cwd=str(repo), check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=str(repo), check=True)
-    subprocess.run(["git", "config", "user.name", "Test"], cwd=str(repo), check=True)
+def _commit_a_txt(repo: Path) -> None:
     (repo / "a.txt").write_text("one\n", encoding="utf-8")
-    subprocess.run(["git", "add", "-A"], cwd=str(repo), check=True)
-    subprocess.run(["git", "commit", "-m", "init"], cwd=str(repo), check=True, capture_output=True)
+    subprocess.run(["git", "add", "a.txt"], cwd=str(repo), check=True)
+    subprocess.run(["git", "commit", "-m", "add a.txt"], cwd=str(repo), stdout=subprocess.DEVNULL, check=True)
 
 
 def test_trim_to_diff_start_prefers_diff_git() -> None:
@@ -22,10 +20,10 @@ def test_trim_to_diff_start_prefers_diff_git() -> None:
     assert trimmed.startswith("diff --git ")
 
 
-def test_apply_patch_accepts_git_style_diff(tmp_path: Path) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir(parents=True)
-    _init_git_repo(repo)
+@pytest.mark.integration
+def test_apply_patch_accepts_git_style_diff(git_repo: Path) -> None:
+    repo = git_repo
+    _commit_a_txt(repo)
 
     patch = (
         "diff --git a/a.txt b/a.txt\n"
@@ -40,10 +38,10 @@ def test_apply_patch_accepts_git_style_diff(tmp_path: Path) -> None:
     assert ok, err
 
 
-def test_apply_patch_accepts_unified_diff_without_diff_git(tmp_path: Path) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir(parents=True)
-    _init_git_repo(repo)
+@pytest.mark.integration
+def test_apply_patch_accepts_unified_diff_without_diff_git(git_repo: Path) -> None:
+    repo = git_repo
+    _commit_a_txt(repo)
 
     patch = (
         "--- a/a.txt\n"
@@ -56,10 +54,10 @@ def test_apply_patch_accepts_unified_diff_without_diff_git(tmp_path: Path) -> No
     assert ok, err
 
 
-def test_apply_patch_rejects_apply_patch_format(tmp_path: Path) -> None:
-    repo = tmp_path / "repo"
-    repo.mkdir(parents=True)
-    _init_git_repo(repo)
+@pytest.mark.integration
+def test_apply_patch_rejects_apply_patch_format(git_repo: Path) -> None:
+    repo = git_repo
+    _commit_a_txt(repo)
 
     patch = "*** Begin Patch\n*** Update File: a.txt\n-one\n+two\n*** End Patch\n"
     ok, err = _apply_patch(repo, patch)
@@ -49,3 +49,12 @@ def test_auto_continue_delay_caps_to_24h():
     response = "Limit reached. Resets 11am (America/Los_Angeles)"
     delay, _ = auto_continue_delay_from_rate_limit(response, default_delay_s=3, now=now)
     assert 0 <= delay <= 24 * 60 * 60
+
+
+def test_auto_continue_delay_unknown_timezone_uses_default():
+    from autocoder.agent.rate_limit import auto_continue_delay_from_rate_limit
+
+    response = "Limit reached. Resets 5pm (Not/A_Zone)"
+    delay, target = auto_continue_delay_from_rate_limit(response, default_delay_s=3)
+    assert delay == 3
+    assert target is None
@@ -1,4 +1,3 @@
-import importlib
 import json
 
 from autocoder.core.database import Database
@@ -42,7 +41,6 @@ def test_feature_report_regression_mcp_tool_creates_issue(tmp_path, monkeypatch)
 
     import autocoder.tools.feature_mcp as feature_mcp
 
-    importlib.reload(feature_mcp)
     db = feature_mcp.get_db()
 
     feature_id = db.create_feature("feat-1", "desc-1", "backend")
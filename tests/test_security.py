@@ -7,11 +7,10 @@ Tests for the bash command security validation logic.
 Run with: pytest tests/test_security.py
 """
 
-import asyncio
 import sys
 
 from autocoder.agent.security import (
-    bash_security_hook,
+    check_bash_command,
     extract_commands,
     validate_chmod_command,
     validate_init_script,
@@ -21,7 +20,7 @@ from autocoder.agent.security import (
 def run_hook_case(command: str, should_block: bool) -> bool:
     """Test a single command against the security hook."""
     input_data = {"tool_name": "Bash", "tool_input": {"command": command}}
-    result = asyncio.run(bash_security_hook(input_data))
+    result = check_bash_command(input_data)
     was_blocked = result.get("decision") == "block"
 
     if was_blocked == should_block:
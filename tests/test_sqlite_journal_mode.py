@@ -1,4 +1,9 @@
-from autocoder.core.database import Database
+import gc
+import sqlite3
+
+import pytest
+
+from autocoder.core.database import Database, get_database
 
 
 def test_sqlite_journal_mode_env_override(tmp_path, monkeypatch):
@@ -19,3 +24,64 @@ def test_sqlite_journal_mode_network_fallback(tmp_path, monkeypatch):
         mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
     assert str(mode).lower() == "delete"
 
+
+def test_sqlite_exclusive_locking_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.delenv("AUTOCODER_SQLITE_EXCLUSIVE", raising=False)
+    db = Database(str(tmp_path / "shared.db"))
+    with db.get_connection() as conn:
+        assert str(conn.execute("PRAGMA locking_mode").fetchone()[0]).lower() == "normal"
+
+    monkeypatch.setenv("AUTOCODER_SQLITE_EXCLUSIVE", "1")
+    db = Database(str(tmp_path / "single.db"))
+    with db.get_connection() as conn:
+        assert str(conn.execute("PRAGMA locking_mode").fetchone()[0]).lower() == "exclusive"
+        conn.execute("INSERT INTO features (name, priority, category) VALUES ('held', 1, 'x')")
+        # Nested use shares the lock-holding connection instead of waiting out busy_timeout.
+        with db.get_connection() as nested:
+            assert nested is conn
+            assert nested.execute("SELECT COUNT(*) FROM features").fetchone()[0] == 1
+
+
+def test_connections_are_pooled_per_thread(tmp_path, monkeypatch):
+    monkeypatch.delenv("AUTOCODER_SQLITE_EXCLUSIVE", raising=False)
+    monkeypatch.delenv("AUTOCODER_SQLITE_POOL", raising=False)
+    db = Database(str(tmp_path / "agent_system.db"))
+
+    with db.get_connection() as outer:
+        # Nested use on the same thread must not share (and commit/roll back) the outer connection.
+        with db.get_connection() as inner:
+            assert inner is not outer
+        outer.execute("INSERT INTO features (name, priority, category) VALUES ('uncommitted', 1, 'x')")
+    with db.get_connection() as again:
+        assert again is outer
+        # Leaving the block without commit discards the write, as closing the connection did.
+        assert again.execute("SELECT COUNT(*) FROM features").fetchone()[0] == 0
+
+    db.close()
+    with db.get_connection() as reopened:
+        assert reopened is not outer
+
+
+def test_get_database_reuses_instance_and_closes_dropped_pools(tmp_path, monkeypatch):
+    monkeypatch.delenv("AUTOCODER_SQLITE_EXCLUSIVE", raising=False)
+    monkeypatch.delenv("AUTOCODER_SQLITE_POOL", raising=False)
+    db = get_database(str(tmp_path))
+    with db.get_connection() as first:
+        pass
+    again = get_database(str(tmp_path))
+    assert again is db
+    with again.get_connection() as second:
+        assert second is first
+
+    # A replaced DB file gets a fresh instance (with schema) instead of the stale pooled handle.
+    (tmp_path / "agent_system.db").unlink()
+    fresh = get_database(str(tmp_path))
+    assert fresh is not db
+    with fresh.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM features").fetchone()[0] == 0
+
+    # Dropping the last reference closes the pooled connection instead of leaving it to GC.
+    del db, again
+    gc.collect()
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
@@ -35,3 +35,22 @@ async def test_terminal_metadata_crud() -> None:
 
     await cleanup_all_terminals()
 
+
+@pytest.mark.asyncio
+async def test_terminal_auto_names_are_monotonic() -> None:
+    project = "test-project-term-names"
+
+    t1 = create_terminal(project)
+    t2 = create_terminal(project)
+    assert (t1.name, t2.name) == ("Terminal 1", "Terminal 2")
+
+    # Deleted numbers are not reused; explicit "Terminal N" names push the counter forward.
+    assert delete_terminal(project, t2.id) is True
+    assert create_terminal(project).name == "Terminal 3"
+    create_terminal(project, "Terminal 7")
+    assert create_terminal(project).name == "Terminal 8"
+
+    await cleanup_all_terminals()
+    assert create_terminal(project).name == "Terminal 1"
+    await cleanup_all_terminals()
+
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from autocoder.server.services.terminal_manager import (
+    TerminalSession,
+    cleanup_all_terminals,
+    create_terminal,
+    get_terminal_session,
+    list_terminals,
+)
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Unix PTY sessions only")
+
+
+async def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("timed out waiting for terminal")
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_terminal_session_roundtrip_and_exit(tmp_path: Path) -> None:
+    session = TerminalSession("test-project-pty", tmp_path)
+    received = bytearray()
+    session.add_output_callback(received.extend)
+
+    assert await session.start() is True
+    try:
+        session.write(b"echo autocoder-$((40 + 2))\n")
+        await _wait_for(lambda: b"autocoder-42" in received)
+
+        # Shell exit closes the PTY; the reader should notice and deactivate the session.
+        session.write(b"exit\n")
+        await _wait_for(lambda: not session.is_active)
+        await _wait_for(lambda: session.pid is None)
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_terminal_output_is_coalesced(tmp_path: Path) -> None:
+    session = TerminalSession("test-project-pty", tmp_path)
+    chunks: list[bytes] = []
+    session.add_output_callback(chunks.append)
+
+    for part in (b"a", b"b", b"c"):
+        session._enqueue_output(part)
+    assert chunks == []
+    await _wait_for(lambda: bool(chunks))
+    assert chunks == [b"abc"]
+
+    session._enqueue_output(b"x" * TerminalSession.FLUSH_MAX_BYTES)
+    assert len(chunks) == 2
+
+
+@pytest.mark.asyncio
+async def test_cleanup_all_terminals_stops_sessions(tmp_path: Path) -> None:
+    project = "test-project-pty-cleanup"
+    sessions = []
+    for _ in range(3):
+        info = create_terminal(project)
+        session = get_terminal_session(project, tmp_path, info.id)
+        assert await session.start() is True
+        sessions.append(session)
+
+    await cleanup_all_terminals()
+    assert not any(s.is_active for s in sessions)
+    assert list_terminals(project) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="requires pidfd (Linux)")
+async def test_shell_exit_detected_while_background_job_holds_pty(tmp_path: Path) -> None:
+    session = TerminalSession("test-project-pty", tmp_path)
+    assert await session.start() is True
+    try:
+        # The background job keeps the PTY open, so only the child-exit watch can notice.
+        session.write(b"sleep 5 & exit\n")
+        await _wait_for(lambda: not session.is_active, timeout=4.0)
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_large_paste_is_written_completely(tmp_path: Path) -> None:
+    session = TerminalSession("test-project-pty", tmp_path)
+    out = tmp_path / "paste.txt"
+    received = bytearray()
+    session.add_output_callback(received.extend)
+    assert await session.start() is True
+    try:
+        session.write(b"stty -echo; echo READY-$((1 + 1)); cat > paste.txt; echo DONE-$((2 + 2))\n")
+        await _wait_for(lambda: b"READY-2" in received)
+        line = b"x" * 999 + b"\n"
+        # Far more than the PTY input buffer holds, split into many small writes.
+        for _ in range(200):
+            session.write(line)
+        session.write(b"\x04")
+        await _wait_for(lambda: b"DONE-4" in received, timeout=10.0)
+        assert out.stat().st_size == 200 * len(line)
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_restart_after_stop_with_pending_write_accepts_input(tmp_path: Path) -> None:
+    session = TerminalSession("test-project-pty", tmp_path)
+    received = bytearray()
+    session.add_output_callback(received.extend)
+    assert await session.start() is True
+    try:
+        # A busy foreground job stops the shell reading, so a large paste fills the PTY and parks.
+        session.write(b"sleep 5\n")
+        for _ in range(200):
+            session.write(b"y" * 999 + b"\n")
+        await _wait_for(lambda: session._write_scheduled and bool(session._write_queue))
+
+        await session.stop()
+        assert await session.start() is True
+        session.write(b"echo restarted-$((3 + 4))\n")
+        await _wait_for(lambda: b"restarted-7" in received)
+    finally:
+        await session.stop()
+
+
+class _FakeBlockingPty:
+    """Stands in for pywinpty's PtyProcess: the first read() blocks on `gate`, then EOF follows."""
+
+    def __init__(self, payload: bytes, gate: threading.Barrier | None = None) -> None:
+        self._payload = payload
+        self._gate = gate
+        self.closed = False
+
+    def read(self, size: int) -> bytes:
+        if self._gate is not None:
+            # Returns only once every terminal's reader is blocked here at the same time.
+            self._gate.wait(timeout=5)
+            self._gate = None
+        if self._payload:
+            data, self._payload = self._payload, b""
+            return data
+        raise EOFError
+
+    def isalive(self) -> bool:
+        return not self.closed
+
+    def terminate(self) -> None:
+        pass
+
+    kill = terminate
+
+    def close(self, force: bool = False) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_windows_reader_serves_more_terminals_than_a_pool_would(tmp_path: Path) -> None:
+    # Each session gets its own reader thread, so the 40th terminal isn't queued behind the rest.
+    sessions = []
+    gate = threading.Barrier(40)
+    for i in range(40):
+        session = TerminalSession("test-project-winpty", tmp_path)
+        received = bytearray()
+        session.add_output_callback(received.extend)
+        session._pty_process = _FakeBlockingPty(f"out-{i}".encode(), gate)
+        session._is_active = True
+        sessions.append((session, received))
+
+    await asyncio.wait_for(asyncio.gather(*(s._read_output_windows() for s, _ in sessions)), timeout=5.0)
+    for i, (session, received) in enumerate(sessions):
+        assert bytes(received) == f"out-{i}".encode()
+        assert not session.is_active
+
+
+@pytest.mark.asyncio
+async def test_stop_windows_closes_the_pty(tmp_path: Path) -> None:
+    session = TerminalSession("test-project-winpty", tmp_path)
+    pty = _FakeBlockingPty(b"")
+    session._pty_process = pty
+    await session._stop_windows()
+    assert pty.closed
+    assert session._pty_process is None
+
+
+@pytest.mark.asyncio
+async def test_write_racing_the_flush_is_not_dropped(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    session = TerminalSession("test-project-pty", tmp_path)
+    received = bytearray()
+    session.add_output_callback(received.extend)
+    assert await session.start() is True
+    try:
+        loop = asyncio.get_running_loop()
+        remove_writer = loop.remove_writer
+        raced = []
+
+        def _remove_writer_then_race(fd):
+            # Input from another thread lands after the drain, while _write_scheduled is still set.
+            result = remove_writer(fd)
+            if not raced:
+                raced.append(True)
+                session.write(b"echo raced-$((5 + 6))\n")
+            return result
+
+        monkeypatch.setattr(loop, "remove_writer", _remove_writer_then_race)
+        session.write(b"true\n")
+        await _wait_for(lambda: b"raced-11" in received)
+    finally:
+        monkeypatch.undo()
+        await session.stop()
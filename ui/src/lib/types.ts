@@ -416,6 +416,7 @@ export interface DevServerStatusResponse {
   url: string | null
   api_port: number | null
   web_port: number | null
+  dropped_lines?: number
 }
 
 export interface DevServerStartRequest {